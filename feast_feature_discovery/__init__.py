@@ -0,0 +1,7 @@
+"""
+Feast Feature Discovery
+
+Scripts for exploring the registered features: built-in listing, Feast CLI,
+interactive Python, exported JSON metadata and DataHub. Each method module
+exposes main() and can also be run directly as a script.
+"""
@@ -0,0 +1,57 @@
+"""
+Keyword Index for Feature Discovery
+
+Shared by the discovery methods to search feature names and descriptions.
+All names are indexed once into a suffix array so each keyword lookup is a
+binary search instead of a substring scan over every name.
+"""
+
+from bisect import bisect_left, bisect_right
+
+
+class NameIndex:
+    """Case-insensitive substring index mapping text to payloads"""
+    
+    def __init__(self):
+        self._payloads = []
+        self._texts = []
+        self._text_payload_ids = []
+        self._suffixes = None
+    
+    def insert(self, payload, *texts):
+        """Index a payload under one or more texts (e.g. a name and a description)"""
+        payload_id = len(self._payloads)
+        self._payloads.append(payload)
+        for text in texts:
+            self._texts.append((text or "").lower())
+            self._text_payload_ids.append(payload_id)
+        self._suffixes = None
+    
+    def _build(self):
+        """Build the sorted suffix array as (text id, offset) pairs"""
+        texts = self._texts
+        suffixes = [(t, i) for t, text in enumerate(texts) for i in range(len(text))]
+        suffixes.sort(key=lambda s: texts[s[0]][s[1]:])
+        self._suffixes = suffixes
+    
+    def find_substring(self, keyword):
+        """Return payloads whose texts contain keyword, in insertion order"""
+        if self._suffixes is None:
+            self._build()
+        
+        keyword = keyword.lower()
+        if not keyword:
+            return list(self._payloads)
+        
+        texts = self._texts
+        width = len(keyword)
+        
+        def prefix(suffix):
+            text_id, offset = suffix
+            return texts[text_id][offset:offset + width]
+        
+        lo = bisect_left(self._suffixes, keyword, key=prefix)
+        hi = bisect_right(self._suffixes, keyword, lo=lo, key=prefix)
+        
+        payload_ids = sorted({self._text_payload_ids[t] for t, _ in self._suffixes[lo:hi]})
+        return [self._payloads[i] for i in payload_ids]
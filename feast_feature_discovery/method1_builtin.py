@@ -6,11 +6,13 @@ Uses the existing list_registered_features function from your codebase.
 Best for: Quick overview of registered features.
 """
 
+import importlib.util
 import sys
 from pathlib import Path
 
-# Add src to path
-sys.path.append(str(Path(__file__).parent.parent / "src"))
+# Add src to path unless the project is installed (pip install -e .)
+if importlib.util.find_spec("feature_store") is None:
+    sys.path.append(str(Path(__file__).parent.parent / "src"))
 
 def main():
     print("🔍 Method 1: Built-in Function Discovery")
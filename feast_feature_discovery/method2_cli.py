@@ -6,8 +6,19 @@ Automates Feast CLI commands for comprehensive feature discovery.
 Best for: Detailed command-line exploration and scripting.
 """
 
+import importlib.util
+import re
 import subprocess
 import sys
+from contextlib import closing
+from pathlib import Path
+
+# Add src to path unless the project is installed (pip install -e .)
+if importlib.util.find_spec("feature_store") is None:
+    sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+# Lines of `feast feature-views describe` output worth showing
+DESCRIBE_KEY_RE = re.compile(r"name:|entities:|features:|description:|uri:", re.IGNORECASE)
 
 def run_feast_command(command):
     """Run a feast CLI command and return the output"""
@@ -17,6 +28,55 @@ def run_feast_command(command):
     except (subprocess.CalledProcessError, FileNotFoundError):
         return None
 
+def run_feast_lines(command):
+    """Run a feast CLI command and yield its output line by line"""
+    try:
+        process = subprocess.Popen(command.split(), stdout=subprocess.PIPE,
+                                   stderr=subprocess.DEVNULL, text=True)
+    except FileNotFoundError:
+        return
+    
+    try:
+        for line in process.stdout:
+            yield line.rstrip('\n')
+    finally:
+        # Stop the command if the caller stopped reading early
+        process.stdout.close()
+        if process.poll() is None:
+            process.terminate()
+        process.wait()
+
+def describe_feature_views_cli(feature_views):
+    """Describe feature views with one `feast feature-views describe` call each"""
+    for fv_name in feature_views:
+        print(f"\n🔸 {fv_name}:")
+        with closing(run_feast_lines(f"feast feature-views describe {fv_name}")) as lines:
+            for i, line in enumerate(lines):
+                if i >= 20:  # Show first 20 lines
+                    break
+                if DESCRIBE_KEY_RE.search(line):
+                    print(line)
+
+def describe_feature_views(feature_views):
+    """Describe feature views from a single in-process registry load"""
+    from feature_store.registry import get_feature_store
+    store = get_feature_store()
+    
+    for fv_name in feature_views:
+        print(f"\n🔸 {fv_name}:")
+        try:
+            fv = store.get_feature_view(fv_name)
+        except Exception as e:
+            print(f"❌ {e}")
+            continue
+        
+        description_lines = (fv.description or "").strip().splitlines()
+        print(f"  name: {fv.name}")
+        print(f"  entities: {fv.entities}")
+        print(f"  features: {[field.name for field in fv.schema]}")
+        print(f"  description: {description_lines[0] if description_lines else ''}")
+        print(f"  uri: {getattr(fv.source, 'path', None)}")
+
 def main():
     print("🔍 Method 2: Feast CLI Discovery")
     print("=" * 60)
@@ -49,14 +109,11 @@ def main():
     print("\n📋 Feature View Details:")
     print("=" * 60)
     
-    for fv_name in feature_views:
-        print(f"\n🔸 {fv_name}:")
-        output = run_feast_command(f"feast feature-views describe {fv_name}")
-        if output:
-            lines = output.split('\n')
-            for line in lines[:20]:  # Show first 20 lines
-                if any(keyword in line.lower() for keyword in ['name:', 'entities:', 'features:', 'description:', 'uri:']):
-                    print(line)
+    try:
+        describe_feature_views(feature_views)
+    except ImportError:
+        # Fall back to one CLI process per feature view
+        describe_feature_views_cli(feature_views)
     
     print("\n✅ CLI Discovery completed successfully!")
 
@@ -6,18 +6,24 @@ Custom Python script for comprehensive feature exploration with search capabilit
 Best for: Custom exploration and programmatic access.
 """
 
+import importlib.util
 import sys
 from pathlib import Path
 
-# Add src to path
-sys.path.append(str(Path(__file__).parent.parent / "src"))
+# Add src and the project root to path unless the project is installed (pip install -e .)
+if importlib.util.find_spec("feature_store") is None:
+    sys.path.append(str(Path(__file__).parent.parent / "src"))
+if importlib.util.find_spec("feast_feature_discovery") is None:
+    sys.path.append(str(Path(__file__).parent.parent))
 
-def explore_feature_views(store):
+from feast_feature_discovery._index import NameIndex
+
+def explore_feature_views(feature_views):
     """Explore feature views in detail"""
     print("\n🔍 Feature Views Detail:")
     print("-" * 60)
     
-    for fv in store.list_feature_views():
+    for fv in feature_views:
         print(f"\n📊 {fv.name}")
         print(f"   Entities: {fv.entities}")
         print(f"   TTL: {fv.ttl}")
@@ -26,50 +32,45 @@ def explore_feature_views(store):
         for field in fv.schema:
             print(f"     - {field.name} ({field.dtype}): {field.description}")
 
-def explore_entities(store):
+def explore_entities(entities):
     """Explore entities"""
     print("\n🔑 Entities Detail:")
     print("-" * 60)
     
-    for entity in store.list_entities():
+    for entity in entities:
         print(f"\n🔑 {entity.name}")
         print(f"   Description: {entity.description}")
         print(f"   Value Type: {entity.value_type}")
 
-def search_features_by_keyword(store, keyword):
+def build_search_index(feature_views, entities):
+    """Index feature view, feature and entity names once for keyword search"""
+    index = NameIndex()
+    
+    for fv in feature_views:
+        index.insert(f"📊 Feature View: {fv.name}", fv.name, fv.description)
+        for field in fv.schema:
+            index.insert(f"   🔸 Feature: {field.name} in {fv.name}", field.name)
+    
+    for entity in entities:
+        index.insert(f"🔑 Entity: {entity.name}", entity.name, entity.description)
+    
+    return index
+
+def search_features_by_keyword(search_index, keyword):
     """Search features by keyword"""
     print(f"\n🔍 Searching for '{keyword}':")
     print("-" * 50)
     
-    found = False
+    matches = search_index.find_substring(keyword)
     
-    # Search in feature views
-    for fv in store.list_feature_views():
-        if keyword.lower() in fv.name.lower() or keyword.lower() in fv.description.lower():
-            print(f"📊 Feature View: {fv.name}")
-            found = True
-        
-        # Search in individual features
-        for field in fv.schema:
-            if keyword.lower() in field.name.lower():
-                print(f"   🔸 Feature: {field.name} in {fv.name}")
-                found = True
-    
-    # Search in entities
-    for entity in store.list_entities():
-        if keyword.lower() in entity.name.lower() or keyword.lower() in entity.description.lower():
-            print(f"🔑 Entity: {entity.name}")
-            found = True
+    for label in matches:
+        print(label)
     
-    if not found:
+    if not matches:
         print(f"❌ No features found matching '{keyword}'")
 
-def get_feature_statistics(store):
+def get_feature_statistics(feature_views, feature_services, entities):
     """Get feature store statistics"""
-    feature_views = list(store.list_feature_views())
-    feature_services = list(store.list_feature_services())
-    entities = list(store.list_entities())
-    
     total_features = sum(len(fv.schema) for fv in feature_views)
     
     print("\n📈 Feature Store Statistics:")
@@ -87,20 +88,26 @@ def main():
         from feature_store.registry import get_feature_store
         store = get_feature_store()
         
+        # Snapshot the registry once and reuse it for every step
+        feature_views = list(store.list_feature_views())
+        feature_services = list(store.list_feature_services())
+        entities = list(store.list_entities())
+        
         # Overview statistics
-        get_feature_statistics(store)
+        get_feature_statistics(feature_views, feature_services, entities)
         
         # Detailed exploration
-        explore_entities(store)
-        explore_feature_views(store)
+        explore_entities(entities)
+        explore_feature_views(feature_views)
         
         # Search examples
         print("\n🔍 Search Examples:")
         print("=" * 60)
         
+        search_index = build_search_index(feature_views, entities)
         search_keywords = ["user", "age", "price", "payment", "session", "transaction"]
         for keyword in search_keywords:
-            search_features_by_keyword(store, keyword)
+            search_features_by_keyword(search_index, keyword)
         
         print("\n✅ Interactive discovery completed successfully!")
         
@@ -6,16 +6,67 @@ Explores features using exported JSON metadata.
 Best for: External integrations and data cataloging.
 """
 
+import importlib.util
 import json
+import mmap
 import os
+import sys
 from pathlib import Path
 from datetime import datetime
+from string import Template
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Add the project root to path unless the project is installed (pip install -e .)
+if importlib.util.find_spec("feast_feature_discovery") is None:
+    sys.path.append(str(Path(__file__).parent.parent))
+
+from feast_feature_discovery._index import NameIndex
+
+# Files above this size are memory-mapped instead of read into a buffer
+MMAP_THRESHOLD_BYTES = 8 * 1024 * 1024
+
+# Summary report templates, compiled once per process
+REPORT_HEADER_TEMPLATE = Template("""# Feature Discovery Report
+
+Generated on: $generated_on
+
+## Overview
+
+- **Feature Store**: $feature_store
+- **Export Timestamp**: $export_timestamp
+
+## Summary Statistics
+
+- **Entities**: $entity_count
+- **Feature Views**: $feature_view_count
+- **Feature Services**: $feature_service_count
+
+## Feature Views
+
+""")
+
+FEATURE_VIEW_SECTION_TEMPLATE = Template("""### $name
+- **Entities**: $entities
+- **Features**: $features
+- **Source**: $source_path
+- **TTL**: $ttl
+
+""")
 
 def load_metadata(metadata_path="data/feature_metadata.json"):
     """Load feature metadata from JSON file"""
     try:
-        with open(metadata_path, 'r') as f:
-            return json.load(f)
+        with open(metadata_path, 'rb') as f:
+            if orjson is None:
+                return json.loads(f.read())
+            if os.fstat(f.fileno()).st_size >= MMAP_THRESHOLD_BYTES:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return orjson.loads(memoryview(mm))
+            return orjson.loads(f.read())
     except FileNotFoundError:
         print(f"❌ Metadata file not found: {metadata_path}")
         print("💡 Generate metadata first: python scripts/run_pipeline.py --export-metadata-only")
@@ -48,71 +99,62 @@ def explore_feature_views_metadata(metadata):
         print(f"   Source: {fv.get('source_path', 'Unknown')}")
         print(f"   TTL: {fv.get('ttl', 'Unknown')}")
 
-def search_metadata_by_keyword(metadata, keyword):
-    """Search metadata by keyword"""
-    print(f"\n🔍 Searching metadata for '{keyword}':")
-    print("-" * 50)
+def build_metadata_search_index(metadata):
+    """Index metadata names once for keyword search"""
+    index = NameIndex()
     
-    found = False
-    
-    # Search in feature views
     for fv in metadata.get('feature_views', []):
         fv_name = fv.get('name', '')
-        if keyword.lower() in fv_name.lower():
-            print(f"📊 Feature View: {fv_name}")
-            found = True
-        
-        # Search in features
+        index.insert(f"📊 Feature View: {fv_name}", fv_name)
         for feature in fv.get('features', []):
-            if keyword.lower() in feature.lower():
-                print(f"   🔸 Feature: {feature} in {fv_name}")
-                found = True
+            index.insert(f"   🔸 Feature: {feature} in {fv_name}", feature)
     
-    # Search in entities
     for entity in metadata.get('entities', []):
         entity_name = entity.get('name', '')
-        if keyword.lower() in entity_name.lower():
-            print(f"🔑 Entity: {entity_name}")
-            found = True
+        index.insert(f"🔑 Entity: {entity_name}", entity_name)
+    
+    return index
+
+def search_metadata_by_keyword(search_index, keyword):
+    """Search metadata by keyword"""
+    print(f"\n🔍 Searching metadata for '{keyword}':")
+    print("-" * 50)
+    
+    matches = search_index.find_substring(keyword)
+    
+    for label in matches:
+        print(label)
     
-    if not found:
+    if not matches:
         print(f"❌ No matches found for '{keyword}'")
 
 def export_summary_report(metadata, output_path="feature_discovery/discovery_report.md"):
     """Export a summary report"""
     print(f"\n📝 Generating summary report: {output_path}")
     
-    report_content = f"""# Feature Discovery Report
-
-Generated on: {datetime.now().isoformat()}
-
-## Overview
-
-- **Feature Store**: {metadata.get('feature_store', 'Unknown')}
-- **Export Timestamp**: {metadata.get('export_timestamp', 'Unknown')}
-
-## Summary Statistics
-
-- **Entities**: {len(metadata.get('entities', []))}
-- **Feature Views**: {len(metadata.get('feature_views', []))}
-- **Feature Services**: {len(metadata.get('feature_services', []))}
-
-## Feature Views
-
-"""
+    report_parts = [REPORT_HEADER_TEMPLATE.substitute(
+        generated_on=datetime.now().isoformat(),
+        feature_store=metadata.get('feature_store', 'Unknown'),
+        export_timestamp=metadata.get('export_timestamp', 'Unknown'),
+        entity_count=len(metadata.get('entities', [])),
+        feature_view_count=len(metadata.get('feature_views', [])),
+        feature_service_count=len(metadata.get('feature_services', [])),
+    )]
     
     # Add feature views
     for fv in metadata.get('feature_views', []):
-        report_content += f"### {fv.get('name', 'Unknown')}\n"
-        report_content += f"- **Entities**: {', '.join(fv.get('entities', []))}\n"
-        report_content += f"- **Features**: {', '.join(fv.get('features', []))}\n"
-        report_content += f"- **Source**: {fv.get('source_path', 'Unknown')}\n"
-        report_content += f"- **TTL**: {fv.get('ttl', 'Unknown')}\n\n"
+        report_parts.append(FEATURE_VIEW_SECTION_TEMPLATE.substitute(
+            name=fv.get('name', 'Unknown'),
+            entities=', '.join(fv.get('entities', [])),
+            features=', '.join(fv.get('features', [])),
+            source_path=fv.get('source_path', 'Unknown'),
+            ttl=fv.get('ttl', 'Unknown'),
+        ))
     
     # Write report
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
     with open(output_path, 'w') as f:
-        f.write(report_content)
+        f.write("".join(report_parts))
     
     print(f"✅ Report saved to: {output_path}")
 
@@ -133,9 +175,10 @@ def main():
     print("\n🔍 Search Examples:")
     print("=" * 60)
     
+    search_index = build_metadata_search_index(metadata)
     search_keywords = ["user", "demographic", "transaction", "product"]
     for keyword in search_keywords:
-        search_metadata_by_keyword(metadata, keyword)
+        search_metadata_by_keyword(search_index, keyword)
     
     # Export report
     export_summary_report(metadata)
@@ -6,20 +6,79 @@ Explores features through DataHub integration for enhanced discovery.
 Best for: Enterprise feature cataloging and lineage tracking.
 """
 
+import hashlib
 import json
 import requests
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
+from string import Template
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # DataHub configuration
 DATAHUB_GMS_URL = "http://localhost:8080"
 DATAHUB_FRONTEND_URL = "http://localhost:9002"
 
+# Max concurrent entity detail requests
+DETAIL_FETCH_WORKERS = 16
+
+# Shared session so all requests reuse keep-alive connections; the pool is
+# sized to the worker count so concurrent detail fetches never drop connections
+session = requests.Session()
+session.mount("http://", requests.adapters.HTTPAdapter(pool_maxsize=DETAIL_FETCH_WORKERS))
+session.mount("https://", requests.adapters.HTTPAdapter(pool_maxsize=DETAIL_FETCH_WORKERS))
+
+# On-disk cache for entity details
+DETAILS_CACHE_DIR = Path.home() / ".cache" / "feast_disco" / "datahub"
+DETAILS_CACHE_TTL_SECONDS = 60 * 60
+
+# Discovery report templates, compiled once per process
+REPORT_HEADER_TEMPLATE = Template("""# DataHub Feature Discovery Report
+
+Generated on: $generated_on
+
+## DataHub Status
+
+- **DataHub URL**: $frontend_url
+- **GMS URL**: $gms_url
+- **Status**: $status
+
+## Feature Summary
+
+- **Total Features Found**: $feature_count
+
+## Feature Details
+
+""")
+
+FEATURE_SECTION_TEMPLATE = Template("""### $name
+- **URN**: $urn
+- **Description**: $description
+""")
+
+FEATURE_PROPERTIES_TEMPLATE = Template("""- **Features**: $feature_count
+- **Entities**: $entities
+- **TTL**: $ttl
+""")
+
+def _parse_json_response(response):
+    """Parse a JSON response body, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+@lru_cache(maxsize=1)
 def check_datahub_health():
-    """Check if DataHub is running and healthy"""
+    """Check if DataHub is running and healthy (memoized; use cache_clear() to recheck)"""
     try:
-        response = requests.get(f"{DATAHUB_GMS_URL}/health", timeout=5)
+        response = session.get(f"{DATAHUB_GMS_URL}/health", timeout=5)
         if response.status_code == 200:
             print("✅ DataHub is running and healthy")
             return True
@@ -45,7 +104,7 @@ def search_datahub_features(search_term="feast"):
             "count": 50
         }
         
-        response = requests.post(
+        response = session.post(
             search_url,
             json=search_payload,
             headers={"Content-Type": "application/json"},
@@ -53,7 +112,7 @@ def search_datahub_features(search_term="feast"):
         )
         
         if response.status_code == 200:
-            results = response.json()
+            results = _parse_json_response(response)
             return results.get("value", {}).get("entities", [])
         else:
             print(f"❌ Search failed: {response.status_code}")
@@ -63,16 +122,53 @@ def search_datahub_features(search_term="feast"):
         print(f"❌ Search error: {e}")
         return []
 
+def _details_cache_path(entity_urn):
+    """Path of the on-disk cache file for an entity URN"""
+    return DETAILS_CACHE_DIR / f"{hashlib.sha1(entity_urn.encode()).hexdigest()}.json"
+
+def _read_cached_details(entity_urn):
+    """Return the cached entry for an entity URN, or None if there is none"""
+    try:
+        with open(_details_cache_path(entity_urn), 'rb') as f:
+            data = f.read()
+        return orjson.loads(data) if orjson is not None else json.loads(data)
+    except (OSError, ValueError):
+        return None
+
+def _write_cached_details(entity_urn, payload, etag=None):
+    """Store entity details in the on-disk cache (best effort)"""
+    try:
+        DETAILS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(_details_cache_path(entity_urn), 'w') as f:
+            json.dump({"timestamp": time.time(), "etag": etag, "payload": payload}, f)
+    except OSError:
+        pass
+
 def get_feature_details(entity_urn):
     """Get detailed information about a feature entity"""
+    cached = _read_cached_details(entity_urn)
+    if cached is not None and time.time() - cached.get("timestamp", 0) <= DETAILS_CACHE_TTL_SECONDS:
+        return cached.get("payload")
+    
+    # Revalidate a stale entry instead of re-downloading it
+    headers = {}
+    if cached is not None and cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+    
     try:
-        response = requests.get(
+        response = session.get(
             f"{DATAHUB_GMS_URL}/entities/{entity_urn}",
+            headers=headers,
             timeout=10
         )
         
-        if response.status_code == 200:
-            return response.json()
+        if response.status_code == 304:
+            _write_cached_details(entity_urn, cached.get("payload"), cached.get("etag"))
+            return cached.get("payload")
+        elif response.status_code == 200:
+            details = _parse_json_response(response)
+            _write_cached_details(entity_urn, details, response.headers.get("ETag"))
+            return details
         else:
             print(f"❌ Failed to get details for {entity_urn}: {response.status_code}")
             return None
@@ -81,6 +177,15 @@ def get_feature_details(entity_urn):
         print(f"❌ Error getting details: {e}")
         return None
 
+def fetch_feature_details(urns):
+    """Fetch details for several entities concurrently, keyed by URN"""
+    unique_urns = list(dict.fromkeys(urns))
+    if not unique_urns:
+        return {}
+    
+    with ThreadPoolExecutor(max_workers=DETAIL_FETCH_WORKERS) as executor:
+        return dict(zip(unique_urns, executor.map(get_feature_details, unique_urns)))
+
 def display_datahub_features(features):
     """Display features found in DataHub"""
     if not features:
@@ -91,6 +196,8 @@ def display_datahub_features(features):
     print(f"\n📊 Found {len(features)} features in DataHub:")
     print("-" * 60)
     
+    details_by_urn = fetch_feature_details(f.get("urn", "") for f in features)
+    
     for i, feature in enumerate(features, 1):
         urn = feature.get("urn", "")
         name = feature.get("name", "Unknown")
@@ -101,7 +208,7 @@ def display_datahub_features(features):
         print(f"   Description: {description[:100]}...")
         
         # Get additional details
-        details = get_feature_details(urn)
+        details = details_by_urn.get(urn)
         if details:
             aspects = details.get("value", {}).get("aspects", [])
             for aspect in aspects:
@@ -120,8 +227,9 @@ def compare_feast_datahub():
     
     # Load Feast metadata
     try:
-        with open("data/feature_metadata.json", 'r') as f:
-            feast_metadata = json.load(f)
+        with open("data/feature_metadata.json", 'rb') as f:
+            data = f.read()
+        feast_metadata = orjson.loads(data) if orjson is not None else json.loads(data)
     except FileNotFoundError:
         print("❌ Feast metadata not found")
         return
@@ -163,35 +271,27 @@ def export_datahub_report():
     # Get all features
     features = search_datahub_features("feast")
     
-    report_content = f"""# DataHub Feature Discovery Report
-
-Generated on: {datetime.now().isoformat()}
-
-## DataHub Status
-
-- **DataHub URL**: {DATAHUB_FRONTEND_URL}
-- **GMS URL**: {DATAHUB_GMS_URL}
-- **Status**: {'Healthy' if check_datahub_health() else 'Unhealthy'}
-
-## Feature Summary
-
-- **Total Features Found**: {len(features)}
-
-## Feature Details
-
-"""
+    report_parts = [REPORT_HEADER_TEMPLATE.substitute(
+        generated_on=datetime.now().isoformat(),
+        frontend_url=DATAHUB_FRONTEND_URL,
+        gms_url=DATAHUB_GMS_URL,
+        status='Healthy' if check_datahub_health() else 'Unhealthy',
+        feature_count=len(features),
+    )]
+    
+    details_by_urn = fetch_feature_details(f.get("urn", "") for f in features)
     
     for feature in features:
-        name = feature.get("name", "Unknown")
-        description = feature.get("description", "No description")
         urn = feature.get("urn", "")
         
-        report_content += f"### {name}\n"
-        report_content += f"- **URN**: {urn}\n"
-        report_content += f"- **Description**: {description}\n"
+        report_parts.append(FEATURE_SECTION_TEMPLATE.substitute(
+            name=feature.get("name", "Unknown"),
+            urn=urn,
+            description=feature.get("description", "No description"),
+        ))
         
         # Get additional details
-        details = get_feature_details(urn)
+        details = details_by_urn.get(urn)
         if details:
             aspects = details.get("value", {}).get("aspects", [])
             for aspect in aspects:
@@ -199,16 +299,18 @@ Generated on: {datetime.now().isoformat()}
                     props = aspect.get("com.linkedin.pegasus2avro.dataset.DatasetProperties", {})
                     custom_props = props.get("customProperties", {})
                     if custom_props:
-                        report_content += f"- **Features**: {custom_props.get('feature_count', 'Unknown')}\n"
-                        report_content += f"- **Entities**: {custom_props.get('entities', 'Unknown')}\n"
-                        report_content += f"- **TTL**: {custom_props.get('ttl', 'Unknown')}\n"
+                        report_parts.append(FEATURE_PROPERTIES_TEMPLATE.substitute(
+                            feature_count=custom_props.get('feature_count', 'Unknown'),
+                            entities=custom_props.get('entities', 'Unknown'),
+                            ttl=custom_props.get('ttl', 'Unknown'),
+                        ))
         
-        report_content += "\n"
+        report_parts.append("\n")
     
     # Write report
     report_path = "feature_discovery/datahub_discovery_report.md"
     with open(report_path, 'w') as f:
-        f.write(report_content)
+        f.write("".join(report_parts))
     
     print(f"✅ DataHub report saved to: {report_path}")
 
@@ -6,11 +6,24 @@ Simple script to get started with feature discovery immediately.
 """
 
 import sys
-import os
+import importlib
+import importlib.util
 from pathlib import Path
 
-# Add src to path
-sys.path.append(str(Path(__file__).parent.parent / "src"))
+# Add src and the project root to path unless the project is installed (pip install -e .)
+if importlib.util.find_spec("feature_store") is None:
+    sys.path.append(str(Path(__file__).parent.parent / "src"))
+if importlib.util.find_spec("feast_feature_discovery") is None:
+    sys.path.append(str(Path(__file__).parent.parent))
+
+# Menu choice -> discovery module
+METHOD_MODULES = {
+    "1": "feast_feature_discovery.method1_builtin",
+    "2": "feast_feature_discovery.method2_cli",
+    "3": "feast_feature_discovery.method3_interactive",
+    "4": "feast_feature_discovery.method4_metadata",
+    "5": "feast_feature_discovery.run_all_methods",
+}
 
 def quick_discovery():
     """Run a quick feature discovery"""
@@ -84,16 +97,12 @@ def main():
         try:
             choice = input("\nEnter your choice (0-5): ").strip()
             
-            if choice == "1":
-                os.system("python feature_discovery/method1_builtin.py")
-            elif choice == "2":
-                os.system("python feature_discovery/method2_cli.py")
-            elif choice == "3":
-                os.system("python feature_discovery/method3_interactive.py")
-            elif choice == "4":
-                os.system("python feature_discovery/method4_metadata.py")
-            elif choice == "5":
-                os.system("python feature_discovery/run_all_methods.py")
+            if choice in METHOD_MODULES:
+                # Run in this process to reuse the already-loaded feature store
+                try:
+                    importlib.import_module(METHOD_MODULES[choice]).main()
+                except Exception as e:
+                    print(f"❌ Error: {e}")
             elif choice == "0":
                 print("👋 Happy feature discovering!")
             else:
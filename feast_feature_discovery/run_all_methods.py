@@ -3,52 +3,93 @@
 Run All Discovery Methods
 
 Executes all feature discovery methods sequentially for comprehensive exploration.
+Methods run in-process so they share one interpreter and one cached FeatureStore.
 """
 
+import argparse
+import importlib
+import importlib.util
+import io
 import sys
-import subprocess
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import redirect_stdout
 from pathlib import Path
 
-def run_method(method_name, script_path):
-    """Run a discovery method and handle errors"""
+# Add the project root to path unless the package is installed (pip install -e .)
+if importlib.util.find_spec("feast_feature_discovery") is None:
+    sys.path.append(str(Path(__file__).parent.parent))
+
+
+def run_method(method_name, module_name):
+    """Run a discovery method in-process and handle errors"""
     print(f"\n{'='*60}")
     print(f"🚀 Running {method_name}")
     print(f"{'='*60}")
     
     try:
-        result = subprocess.run([sys.executable, script_path], check=True)
-        print(f"✅ {method_name} completed successfully!")
-        return True
-    except subprocess.CalledProcessError:
+        module = importlib.import_module(module_name)
+        result = module.main()
+    except Exception as e:
+        print(f"❌ {method_name} failed: {e}")
+        return False
+    
+    if result is False:
         print(f"❌ {method_name} failed")
         return False
+    
+    print(f"✅ {method_name} completed successfully!")
+    return True
 
-def main():
+def run_method_captured(method_name, module_name):
+    """Run a discovery method with its output captured, for use in a worker process"""
+    buffer = io.StringIO()
+    with redirect_stdout(buffer):
+        success = run_method(method_name, module_name)
+    return success, buffer.getvalue()
+
+def main(interactive=False, parallel=False):
     print("🔍 Feature Discovery - All Methods")
     print("=" * 60)
     
-    # Get the directory of this script
-    script_dir = Path(__file__).parent
-    
     # Define methods to run
     methods = [
-        ("Method 1: Built-in Function", script_dir / "method1_builtin.py"),
-        ("Method 2: Feast CLI", script_dir / "method2_cli.py"),
-        ("Method 3: Interactive Python", script_dir / "method3_interactive.py"),
-        ("Method 4: JSON Metadata", script_dir / "method4_metadata.py"),
+        ("Method 1: Built-in Function", "feast_feature_discovery.method1_builtin"),
+        ("Method 2: Feast CLI", "feast_feature_discovery.method2_cli"),
+        ("Method 3: Interactive Python", "feast_feature_discovery.method3_interactive"),
+        ("Method 4: JSON Metadata", "feast_feature_discovery.method4_metadata"),
     ]
     
     # Track results
     results = {}
     
-    # Run each method
-    for method_name, script_path in methods:
-        success = run_method(method_name, script_path)
-        results[method_name] = success
+    if parallel:
+        # Methods only read the registry/metadata, so they can run side by side
+        with ProcessPoolExecutor(max_workers=len(methods)) as executor:
+            futures = {
+                executor.submit(run_method_captured, method_name, module_name): method_name
+                for method_name, module_name in methods
+            }
+            for future in as_completed(futures):
+                method_name = futures[future]
+                try:
+                    success, output = future.result()
+                except Exception as e:
+                    success, output = False, f"❌ {method_name} failed: {e}\n"
+                print(output, end="")
+                results[method_name] = success
         
-        # Add separator between methods
-        print("\n" + "🔄" * 60)
-        input("Press Enter to continue to next method (or Ctrl+C to stop)...")
+        # Report in the declared order regardless of completion order
+        results = {method_name: results[method_name] for method_name, _ in methods}
+    else:
+        # Run each method
+        for method_name, module_name in methods:
+            success = run_method(method_name, module_name)
+            results[method_name] = success
+            
+            # Add separator between methods
+            print("\n" + "🔄" * 60)
+            if interactive:
+                input("Press Enter to continue to next method (or Ctrl+C to stop)...")
     
     # Summary
     print(f"\n{'='*60}")
@@ -70,7 +111,12 @@ def main():
         print("⚠️  Some methods failed. Check the error messages above.")
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run all feature discovery methods")
+    parser.add_argument("--interactive", action="store_true", help="Pause between methods")
+    parser.add_argument("--parallel", action="store_true", help="Run methods concurrently in worker processes")
+    args = parser.parse_args()
+    
     try:
-        main()
+        main(interactive=args.interactive, parallel=args.parallel)
     except KeyboardInterrupt:
-        print("\n\n🛑 Discovery stopped by user") 
\ No newline at end of file
+        print("\n\n🛑 Discovery stopped by user")
@@ -11,13 +11,16 @@ Usage:
     python scripts/run_pipeline.py [options]
 """
 
+import importlib.util
+import logging
 import sys
 import os
 import argparse
 from pathlib import Path
 
-# Add src to path
-sys.path.append(str(Path(__file__).parent.parent / "src"))
+# Add src to path unless the project is installed (pip install -e .)
+if importlib.util.find_spec("feature_store") is None:
+    sys.path.append(str(Path(__file__).parent.parent / "src"))
 
 from pipeline import run_complete_pipeline, generate_all_features, register_features_in_feast
 
@@ -63,7 +66,7 @@ Examples:
     parser.add_argument(
         "--use-s3",
         action="store_true",
-        help="Use S3 sources instead of local CSV files"
+        help="Use S3 sources instead of local Parquet files"
     )
     
     # Pipeline phases
@@ -109,7 +112,7 @@ Examples:
     parser.add_argument(
         "--verbose",
         action="store_true",
-        help="Enable verbose output"
+        help="Enable verbose output (step progress and tracebacks)"
     )
     parser.add_argument(
         "--dry-run",
@@ -119,6 +122,10 @@ Examples:
     
     args = parser.parse_args()
     
+    # Pipeline modules log step progress at INFO; only show it when asked
+    if args.verbose:
+        logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+    
     # Validate arguments
     if sum([args.generate_only, args.register_only, args.export_metadata_only]) > 1:
         print("❌ Error: Cannot specify multiple 'only' options")
@@ -8,6 +8,32 @@ import os
 from pathlib import Path
 
 
+def _run_ingestion_in_process(config_path: Path, project_root: Path) -> None:
+    """Run the ingestion recipe with DataHub's Python pipeline API.
+    
+    Avoids spawning the ``datahub`` CLI (and re-importing DataHub) per run.
+    
+    Args:
+        config_path: Path to the DataHub ingestion recipe.
+        project_root: Directory that relative paths in the recipe refer to.
+    """
+    from datahub.configuration.config_loader import load_config_file
+    from datahub.ingestion.run.pipeline import Pipeline
+    
+    config = load_config_file(config_path)
+    
+    # The recipe uses paths relative to the project root, where the CLI was run
+    source_config = config.get("source", {}).get("config", {})
+    for key in ("path", "registry_path"):
+        value = source_config.get(key)
+        if value and not os.path.isabs(value):
+            source_config[key] = str(project_root / value)
+    
+    pipeline = Pipeline.create(config)
+    pipeline.run()
+    pipeline.raise_from_status()
+
+
 def run_datahub_ingestion(verbose: bool = True) -> bool:
     """Run DataHub ingestion for Feast metadata.
     
@@ -34,15 +60,32 @@ def run_datahub_ingestion(verbose: bool = True) -> bool:
     if verbose:
         print("🚀 Starting DataHub ingestion...")
     
+    # Import the SDK up front so only a missing DataHub install triggers the CLI fallback;
+    # ImportErrors raised while the pipeline runs (e.g. a missing source plugin) are real errors
+    ingestion_errors = (subprocess.CalledProcessError, FileNotFoundError)
+    try:
+        from datahub.configuration.common import ConfigurationError, PipelineExecutionError
+        from datahub.ingestion.run.pipeline import PipelineInitError
+        from pydantic import ValidationError
+    except ImportError:
+        sdk_available = False
+    else:
+        sdk_available = True
+        ingestion_errors += (ConfigurationError, ValidationError, PipelineInitError, PipelineExecutionError)
+    
     try:
-        # Run ingestion
-        result = subprocess.run(
-            ["datahub", "ingest", "-c", str(config_path)],
-            cwd=project_root,
-            capture_output=True,
-            text=True,
-            check=True
-        )
+        if sdk_available:
+            # Run ingestion in-process
+            _run_ingestion_in_process(config_path, project_root)
+        else:
+            # DataHub SDK not importable here; fall back to the CLI
+            subprocess.run(
+                ["datahub", "ingest", "-c", str(config_path)],
+                cwd=project_root,
+                capture_output=True,
+                text=True,
+                check=True
+            )
         
         if verbose:
             print("✅ DataHub ingestion completed successfully!")
@@ -50,7 +93,7 @@ def run_datahub_ingestion(verbose: bool = True) -> bool:
         
         return True
         
-    except (subprocess.CalledProcessError, FileNotFoundError) as e:
+    except ingestion_errors as e:
         if verbose:
             print(f"❌ Error: {e}")
         return False
@@ -1,15 +1,32 @@
 """
 Data Export Module
 
-This module handles exporting engineered features to CSV files for use in the feature store.
+This module handles exporting engineered features to Parquet (and CSV) files for use in the feature store.
 """
 
+import csv
+import logging
 import os
 import pandas as pd
-from typing import Dict, Optional
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
 
+# Per-file progress goes to the logger; summaries are still printed
+logger = logging.getLogger(__name__)
+
+# Write buffer size for CSV exports
+CSV_WRITE_BUFFER_BYTES = 1 << 20
+
+# Feature Parquet files: Snappy decodes fastest for Feast's readers, and row groups
+# of this size keep each feature view in a handful of groups
+FEATURE_PARQUET_COMPRESSION = "snappy"
+FEATURE_PARQUET_ROW_GROUP_SIZE = 100_000
+
+
 def ensure_directory_exists(directory: str) -> None:
     """
     Ensure a directory exists, create it if it doesn't
@@ -22,6 +39,64 @@ def ensure_directory_exists(directory: str) -> None:
         print(f"📁 Created directory: {directory}")
 
 
+def write_csv(df: pd.DataFrame, filepath: str) -> None:
+    """
+    Write a DataFrame to CSV using Arrow's C++ writer
+    
+    Falls back to pandas for columns Arrow cannot convert (e.g. mixed-type objects).
+    
+    Args:
+        df: DataFrame to write
+        filepath: Destination CSV path
+    """
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        table = None
+    
+    # One large buffered binary handle keeps the number of write() syscalls low
+    with open(filepath, 'wb', buffering=CSV_WRITE_BUFFER_BYTES) as f:
+        if table is not None:
+            pa_csv.write_csv(table, f)
+        else:
+            df.to_csv(f, index=False)
+
+
+def read_csv_shape(filepath: str) -> Tuple[int, List[str]]:
+    """
+    Get the row count and header of a CSV file
+    
+    Records are counted with csv.reader rather than by line endings, so quoted
+    fields containing newlines count once.
+    
+    Args:
+        filepath: CSV file to inspect
+    
+    Returns:
+        Tuple of (number of data rows, column names)
+    """
+    with open(filepath, 'r', newline='') as f:
+        reader = csv.reader(f)
+        columns = next(reader, [])
+        row_count = sum(1 for _ in reader)
+    
+    return row_count, columns
+
+
+def read_parquet_shape(filepath: str) -> Tuple[int, List[str]]:
+    """
+    Get the row count and column names of a Parquet file from its footer
+    
+    Args:
+        filepath: Parquet file to inspect
+    
+    Returns:
+        Tuple of (number of rows, column names)
+    """
+    metadata = pq.read_metadata(filepath)
+    return metadata.num_rows, metadata.schema.to_arrow_schema().names
+
+
 def export_features_to_csv(
     engineered_features: Dict[str, pd.DataFrame],
     output_dir: str = "data/transformed"
@@ -49,9 +124,9 @@ def export_features_to_csv(
             filepath = os.path.join(output_dir, filename)
             
             # Export to CSV
-            df.to_csv(filepath, index=False)
+            write_csv(df, filepath)
             
-            print(f"✅ Exported {feature_name} features: {df.shape[0]} rows, {df.shape[1]} columns")
+            logger.info("✅ Exported %s features: %d rows, %d columns", feature_name, df.shape[0], df.shape[1])
         
         print("✅ All features exported successfully!")
         return True
@@ -61,6 +136,97 @@ def export_features_to_csv(
         return False
 
 
+def export_features_to_parquet(
+    engineered_features: Dict[str, pd.DataFrame],
+    output_dir: str = "data/transformed"
+) -> bool:
+    """
+    Export engineered features to Parquet files
+    
+    Parquet is columnar and compressed, so readers can load only the columns they need.
+    
+    Args:
+        engineered_features: Dictionary containing engineered feature DataFrames
+        output_dir: Directory to save Parquet files
+    
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    try:
+        # Ensure output directory exists
+        ensure_directory_exists(output_dir)
+        
+        print(f"📤 Exporting features to {output_dir}...")
+        
+        # Export each feature set
+        for feature_name, df in engineered_features.items():
+            # Create filename
+            filename = f"{feature_name}_features.parquet"
+            filepath = os.path.join(output_dir, filename)
+            
+            # Store categorical columns as plain values so readers see the declared types
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            for i, field in enumerate(table.schema):
+                if pa.types.is_dictionary(field.type):
+                    table = table.set_column(i, field.name, table.column(i).cast(field.type.value_type))
+            
+            # Export to Parquet
+            pq.write_table(
+                table, filepath,
+                compression=FEATURE_PARQUET_COMPRESSION,
+                row_group_size=FEATURE_PARQUET_ROW_GROUP_SIZE
+            )
+            
+            logger.info("✅ Exported %s features: %d rows, %d columns", feature_name, df.shape[0], df.shape[1])
+        
+        print("✅ All features exported successfully!")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Error exporting features: {e}")
+        return False
+
+
+def convert_feature_csvs_to_parquet(output_dir: str = "data/transformed") -> bool:
+    """
+    Convert previously exported feature CSV files to Parquet next to them
+    
+    One-off migration for feature directories written before the feature
+    store sources moved to Parquet.
+    
+    Args:
+        output_dir: Directory containing *_features.csv files
+    
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    try:
+        suffix = "_features.csv"
+        feature_files = sorted(
+            entry.name for entry in os.scandir(output_dir)
+            if entry.is_file() and entry.name.endswith(suffix)
+        )
+        
+        if not feature_files:
+            print(f"⚠️  No feature CSV files found in {output_dir}")
+            return True
+        
+        engineered_features = {
+            filename[:-len(suffix)]: pd.read_csv(
+                os.path.join(output_dir, filename),
+                engine="pyarrow",
+                parse_dates=["event_timestamp"]
+            )
+            for filename in feature_files
+        }
+        
+        return export_features_to_parquet(engineered_features, output_dir)
+        
+    except Exception as e:
+        print(f"❌ Error converting feature CSV files: {e}")
+        return False
+
+
 def export_raw_data_to_csv(
     raw_data: Dict[str, pd.DataFrame],
     output_dir: str = "data/raw"
@@ -88,9 +254,48 @@ def export_raw_data_to_csv(
             filepath = os.path.join(output_dir, filename)
             
             # Export to CSV
-            df.to_csv(filepath, index=False)
+            write_csv(df, filepath)
             
-            print(f"✅ Exported {data_name} data: {df.shape[0]} rows, {df.shape[1]} columns")
+            logger.info("✅ Exported %s data: %d rows, %d columns", data_name, df.shape[0], df.shape[1])
+        
+        print("✅ All raw data exported successfully!")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Error exporting raw data: {e}")
+        return False
+
+
+def export_raw_data_to_parquet(
+    raw_data: Dict[str, pd.DataFrame],
+    output_dir: str = "data/raw"
+) -> bool:
+    """
+    Export raw data to Parquet files so it can be reloaded without CSV parsing
+    
+    Args:
+        raw_data: Dictionary containing raw data DataFrames
+        output_dir: Directory to save Parquet files
+    
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    try:
+        # Ensure output directory exists
+        ensure_directory_exists(output_dir)
+        
+        print(f"📤 Exporting raw data to {output_dir}...")
+        
+        # Export each dataset
+        for data_name, df in raw_data.items():
+            # Create filename
+            filename = f"{data_name}.parquet"
+            filepath = os.path.join(output_dir, filename)
+            
+            # Export to Parquet (columnar, typed, zstd-compressed)
+            df.to_parquet(filepath, engine="pyarrow", compression="zstd", index=False)
+            
+            logger.info("✅ Exported %s data: %d rows, %d columns", data_name, df.shape[0], df.shape[1])
         
         print("✅ All raw data exported successfully!")
         return True
@@ -156,7 +361,8 @@ def create_feature_summary(
 
 def validate_exported_files(
     engineered_features: Dict[str, pd.DataFrame],
-    output_dir: str = "data/transformed"
+    output_dir: str = "data/transformed",
+    file_format: str = "csv"
 ) -> bool:
     """
     Validate that exported files exist and have correct content
@@ -164,6 +370,7 @@ def validate_exported_files(
     Args:
         engineered_features: Dictionary containing engineered feature DataFrames
         output_dir: Directory containing exported files
+        file_format: Format the features were exported in ("csv" or "parquet")
     
     Returns:
         bool: True if all files are valid, False otherwise
@@ -172,7 +379,7 @@ def validate_exported_files(
         print("🔍 Validating exported files...")
         
         for feature_name, df in engineered_features.items():
-            filename = f"{feature_name}_features.csv"
+            filename = f"{feature_name}_features.{file_format}"
             filepath = os.path.join(output_dir, filename)
             
             # Check if file exists
@@ -186,20 +393,24 @@ def validate_exported_files(
                 print(f"❌ Empty file: {filepath}")
                 return False
             
-            # Load and validate content
-            exported_df = pd.read_csv(filepath)
+            # Read the Parquet footer or stream CSV records rather than loading a DataFrame
+            if file_format == "parquet":
+                row_count, columns = read_parquet_shape(filepath)
+            else:
+                row_count, columns = read_csv_shape(filepath)
+            exported_shape = (row_count, len(columns))
             
             # Check shape
-            if exported_df.shape != df.shape:
-                print(f"❌ Shape mismatch for {feature_name}: expected {df.shape}, got {exported_df.shape}")
+            if exported_shape != df.shape:
+                print(f"❌ Shape mismatch for {feature_name}: expected {df.shape}, got {exported_shape}")
                 return False
             
             # Check columns
-            if list(exported_df.columns) != list(df.columns):
+            if columns != list(df.columns):
                 print(f"❌ Column mismatch for {feature_name}")
                 return False
             
-            print(f"✅ Validated {feature_name}: {exported_df.shape[0]} rows, {exported_df.shape[1]} columns")
+            logger.info("✅ Validated %s: %d rows, %d columns", feature_name, exported_shape[0], exported_shape[1])
         
         print("✅ All exported files validated successfully!")
         return True
@@ -227,15 +438,13 @@ def cleanup_old_files(output_dir: str = "data/transformed", days: int = 7) -> bo
         cutoff_time = datetime.now().timestamp() - (days * 24 * 60 * 60)
         removed_count = 0
         
-        for filename in os.listdir(output_dir):
-            if filename.endswith('_features.csv'):
-                filepath = os.path.join(output_dir, filename)
-                file_time = os.path.getmtime(filepath)
-                
-                if file_time < cutoff_time:
-                    os.remove(filepath)
+        # scandir yields entries in batches and caches their stat results
+        with os.scandir(output_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith('_features.csv') and entry.stat().st_mtime < cutoff_time:
+                    os.remove(entry.path)
                     removed_count += 1
-                    print(f"🗑️ Removed old file: {filename}")
+                    logger.info("🗑️ Removed old file: %s", entry.name)
         
         if removed_count > 0:
             print(f"✅ Cleaned up {removed_count} old files")
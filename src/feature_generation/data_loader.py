@@ -5,39 +5,79 @@ This module handles loading raw data from various sources and preprocessing
 it for feature engineering.
 """
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 
 
+# Value tables for sample data, built once so each column is a single batched draw
+GENDERS = np.array(['M', 'F', 'Other'])
+GENDER_WEIGHTS = [0.45, 0.45, 0.1]
+
+LOCATIONS = np.array([
+    'New York', 'Los Angeles', 'Chicago', 'Houston', 'Phoenix',
+    'Philadelphia', 'San Antonio', 'San Diego', 'Dallas', 'San Jose'
+])
+
+FAVORITE_CATEGORIES = np.array(['Electronics', 'Clothing', 'Books', 'Home', 'Sports'])
+
+PAYMENT_METHODS = np.array(['Credit Card', 'Debit Card', 'PayPal', 'Apple Pay', 'Google Pay'])
+PAYMENT_METHOD_WEIGHTS = [0.4, 0.3, 0.15, 0.1, 0.05]
+
+PRODUCT_CATEGORIES = np.array([
+    'Electronics', 'Clothing', 'Books', 'Home', 'Sports',
+    'Beauty', 'Toys', 'Automotive', 'Health', 'Garden'
+])
+
+NS_PER_DAY = 24 * 60 * 60 * 10**9
+
+
+def days_since(timestamps, now: datetime) -> np.ndarray:
+    """
+    Whole days from each timestamp until now, same as (now - timestamps).dt.days
+    
+    Works on the int64 nanosecond representation instead of building Timedeltas.
+    
+    Args:
+        timestamps: Datetime values (Series, DatetimeIndex or datetime64 array)
+        now: Reference time
+    
+    Returns:
+        int64 array of elapsed days
+    """
+    timestamps_ns = np.asarray(timestamps, dtype='datetime64[ns]').view('i8')
+    return (np.datetime64(now, 'ns').view('i8') - timestamps_ns) // NS_PER_DAY
+
+
 def generate_sample_user_data(n_users: int = 1000) -> pd.DataFrame:
     """Generate sample user demographic data"""
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
     
     # Generate user IDs
-    user_ids = list(range(1, n_users + 1))
+    user_ids = np.arange(1, n_users + 1)
     
     # Generate demographic features
-    ages = np.random.normal(35, 12, n_users).astype(int)
+    ages = rng.normal(35, 12, n_users).astype(int)
     ages = np.clip(ages, 18, 80)
     
-    genders = np.random.choice(['M', 'F', 'Other'], n_users, p=[0.45, 0.45, 0.1])
+    genders = rng.choice(GENDERS, n_users, p=GENDER_WEIGHTS)
+    
+    locations = rng.choice(LOCATIONS, n_users)
     
-    locations = np.random.choice([
-        'New York', 'Los Angeles', 'Chicago', 'Houston', 'Phoenix',
-        'Philadelphia', 'San Antonio', 'San Diego', 'Dallas', 'San Jose'
-    ], n_users)
+    # Read the clock once; it is used for registration dates and the event timestamp
+    now = datetime.now()
     
-    # Generate registration dates (last 2 years)
-    start_date = datetime.now() - timedelta(days=730)
-    registration_dates = [
-        start_date + timedelta(days=np.random.randint(0, 730))
-        for _ in range(n_users)
-    ]
+    # Generate registration dates (last 2 years), drawn as one batch
+    start_date = now - timedelta(days=730)
+    registration_dates = np.datetime64(start_date, 'ns') + (
+        rng.integers(0, 730, n_users).astype('timedelta64[D]')
+    )
     
     # Generate premium status
-    is_premium = np.random.choice([True, False], n_users, p=[0.2, 0.8])
+    is_premium = rng.choice([True, False], n_users, p=[0.2, 0.8])
     
     # Create DataFrame
     df = pd.DataFrame({
@@ -47,7 +87,7 @@ def generate_sample_user_data(n_users: int = 1000) -> pd.DataFrame:
         'location': locations,
         'registration_date': registration_dates,
         'is_premium': is_premium,
-        'event_timestamp': datetime.now()
+        'event_timestamp': now
     })
     
     return df
@@ -55,49 +95,41 @@ def generate_sample_user_data(n_users: int = 1000) -> pd.DataFrame:
 
 def generate_sample_behavior_data(n_users: int = 1000, days: int = 30) -> pd.DataFrame:
     """Generate sample user behavior data"""
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
     
-    data = []
     end_date = datetime.now()
     start_date = end_date - timedelta(days=days)
     
-    for user_id in range(1, n_users + 1):
-        # Generate session data for each user
-        n_sessions = np.random.poisson(15)  # Average 15 sessions per user
-        
-        for _ in range(n_sessions):
-            session_date = start_date + timedelta(
-                days=np.random.randint(0, days),
-                hours=np.random.randint(0, 24),
-                minutes=np.random.randint(0, 60)
-            )
-            
-            session_duration = np.random.exponential(30)  # Average 30 minutes
-            session_duration = min(session_duration, 180)  # Cap at 3 hours
-            
-            data.append({
-                'user_id': user_id,
-                'session_duration': session_duration,
-                'session_date': session_date,
-                'event_timestamp': session_date
-            })
-    
-    df = pd.DataFrame(data)
-    
-    # Aggregate by user
-    user_behavior = df.groupby('user_id').agg({
-        'session_duration': ['mean', 'count'],
-        'session_date': 'max'
-    }).reset_index()
-    
-    user_behavior.columns = ['user_id', 'avg_session_duration', 'total_sessions', 'last_session_date']
+    # Draw every session in one batch instead of row by row
+    n_sessions = rng.poisson(15, n_users)  # Average 15 sessions per user
+    user_ids = np.repeat(np.arange(1, n_users + 1), n_sessions)
+    total = len(user_ids)
+    
+    # Session start as a minute offset into the window
+    session_dates = np.datetime64(start_date, 'ns') + (
+        rng.integers(0, days * 24 * 60, total).astype('timedelta64[m]')
+    )
+    
+    session_durations = rng.exponential(30, total)  # Average 30 minutes
+    session_durations = np.minimum(session_durations, 180)  # Cap at 3 hours
+    
+    # Aggregate by user straight from the session arrays: rows are sorted by user,
+    # so each user is one contiguous segment (no per-session DataFrame or groupby)
+    has_sessions = n_sessions > 0
+    segment_starts = (np.cumsum(n_sessions) - n_sessions)[has_sessions]
+    total_sessions = n_sessions[has_sessions]
+    
+    user_behavior = pd.DataFrame({
+        'user_id': np.arange(1, n_users + 1)[has_sessions],
+        'avg_session_duration': np.add.reduceat(session_durations, segment_starts) / total_sessions,
+        'total_sessions': total_sessions,
+        'last_session_date': np.maximum.reduceat(session_dates, segment_starts)
+    })
     
     # Add additional features
-    user_behavior['favorite_category'] = np.random.choice([
-        'Electronics', 'Clothing', 'Books', 'Home', 'Sports'
-    ], len(user_behavior))
+    user_behavior['favorite_category'] = rng.choice(FAVORITE_CATEGORIES, len(user_behavior))
     
-    user_behavior['last_login_days'] = np.random.randint(0, 30, len(user_behavior))
+    user_behavior['last_login_days'] = rng.integers(0, 30, len(user_behavior))
     
     # Calculate engagement score (0-100)
     user_behavior['engagement_score'] = (
@@ -106,97 +138,97 @@ def generate_sample_behavior_data(n_users: int = 1000, days: int = 30) -> pd.Dat
         (30 - user_behavior['last_login_days']) * 1.5
     ).clip(0, 100)
     
-    user_behavior['event_timestamp'] = datetime.now()
+    user_behavior['event_timestamp'] = end_date
     
     return user_behavior
 
 
 def generate_sample_transaction_data(n_users: int = 1000, days: int = 365) -> pd.DataFrame:
     """Generate sample transaction data"""
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
     
-    data = []
     end_date = datetime.now()
     start_date = end_date - timedelta(days=days)
     
-    for user_id in range(1, n_users + 1):
-        # Generate transaction data for each user
-        n_transactions = np.random.poisson(8)  # Average 8 transactions per user
-        
-        for _ in range(n_transactions):
-            transaction_date = start_date + timedelta(
-                days=np.random.randint(0, days),
-                hours=np.random.randint(0, 24),
-                minutes=np.random.randint(0, 60)
-            )
-            
-            # Generate transaction amount (lognormal distribution)
-            amount = np.random.lognormal(3.5, 0.8)  # Mean ~$50
-            amount = min(amount, 1000)  # Cap at $1000
-            
-            payment_method = np.random.choice([
-                'Credit Card', 'Debit Card', 'PayPal', 'Apple Pay', 'Google Pay'
-            ], p=[0.4, 0.3, 0.15, 0.1, 0.05])
-            
-            data.append({
-                'user_id': user_id,
-                'amount': amount,
-                'payment_method': payment_method,
-                'transaction_date': transaction_date,
-                'event_timestamp': transaction_date
-            })
-    
-    df = pd.DataFrame(data)
-    
-    # Aggregate by user
-    user_transactions = df.groupby('user_id').agg({
-        'amount': ['sum', 'mean', 'count'],
-        'payment_method': lambda x: x.mode().iloc[0] if len(x.mode()) > 0 else 'Credit Card',
-        'transaction_date': 'max'
-    }).reset_index()
-    
-    user_transactions.columns = [
-        'user_id', 'total_spent', 'avg_order_value', 'total_orders',
-        'favorite_payment_method', 'last_purchase_date'
-    ]
+    # Draw every transaction in one batch instead of row by row
+    n_transactions = rng.poisson(8, n_users)  # Average 8 transactions per user
+    user_ids = np.repeat(np.arange(1, n_users + 1), n_transactions)
+    total = len(user_ids)
+    
+    # Day, hour and minute offsets combined as integer minutes on a datetime64 base
+    offset_minutes = (
+        rng.integers(0, days, total) * 24 * 60 +
+        rng.integers(0, 24, total) * 60 +
+        rng.integers(0, 60, total)
+    )
+    transaction_dates = np.datetime64(start_date, 'ns') + offset_minutes.astype('timedelta64[m]')
+    
+    # Generate transaction amounts (lognormal distribution)
+    amounts = rng.lognormal(3.5, 0.8, total)  # Mean ~$50
+    amounts = np.minimum(amounts, 1000)  # Cap at $1000
+    
+    # Draw payment methods as indices into PAYMENT_METHODS
+    payment_codes = rng.choice(len(PAYMENT_METHODS), total, p=PAYMENT_METHOD_WEIGHTS)
+    
+    # Aggregate by user: rows are already sorted by user, so each user is one
+    # contiguous segment and the sums/maxima reduce with reduceat (no groupby)
+    has_transactions = n_transactions > 0
+    segment_starts = (np.cumsum(n_transactions) - n_transactions)[has_transactions]
+    total_orders = n_transactions[has_transactions]
+    total_spent = np.add.reduceat(amounts, segment_starts)
+    last_purchase_dates = np.maximum.reduceat(transaction_dates, segment_starts)
+    
+    # Favorite payment method = per-user mode: count (user, method) pairs with one
+    # bincount, then argmax over methods ranked alphabetically so ties resolve
+    # to the alphabetically first method, as Series.mode() does
+    n_methods = len(PAYMENT_METHODS)
+    method_counts = np.bincount(
+        (user_ids - 1) * n_methods + payment_codes, minlength=n_users * n_methods
+    ).reshape(n_users, n_methods)[has_transactions]
+    alphabetical = np.argsort(PAYMENT_METHODS)
+    favorite_payment_methods = PAYMENT_METHODS[alphabetical[method_counts[:, alphabetical].argmax(axis=1)]]
+    
+    user_transactions = pd.DataFrame({
+        'user_id': np.arange(1, n_users + 1)[has_transactions],
+        'total_spent': total_spent,
+        'avg_order_value': total_spent / total_orders,
+        'total_orders': total_orders,
+        'favorite_payment_method': favorite_payment_methods,
+        'last_purchase_date': last_purchase_dates
+    })
     
     # Calculate days since last purchase
-    user_transactions['last_purchase_days'] = (
-        end_date - user_transactions['last_purchase_date']
-    ).dt.days
+    user_transactions['last_purchase_days'] = days_since(last_purchase_dates, end_date)
     
-    user_transactions['event_timestamp'] = datetime.now()
+    user_transactions['event_timestamp'] = end_date
     
     return user_transactions
 
 
 def generate_sample_product_data(n_products: int = 500) -> pd.DataFrame:
     """Generate sample product data"""
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
     
     # Generate product IDs
-    product_ids = list(range(1, n_products + 1))
+    product_ids = np.arange(1, n_products + 1)
     
     # Generate product features
-    categories = np.random.choice([
-        'Electronics', 'Clothing', 'Books', 'Home', 'Sports',
-        'Beauty', 'Toys', 'Automotive', 'Health', 'Garden'
-    ], n_products)
+    categories = rng.choice(PRODUCT_CATEGORIES, n_products)
     
     # Generate prices (lognormal distribution)
-    prices = np.random.lognormal(3.2, 0.6)  # Mean ~$25
+    prices = rng.lognormal(3.2, 0.6)  # Mean ~$25
     prices = np.clip(prices, 5, 500)  # Between $5 and $500
     
     # Generate ratings (normal distribution)
-    ratings = np.random.normal(4.2, 0.8, n_products)
+    ratings = rng.normal(4.2, 0.8, n_products)
     ratings = np.clip(ratings, 1, 5)
     
     # Generate review counts (poisson distribution)
-    review_counts = np.random.poisson(50, n_products)
+    review_counts = rng.poisson(50, n_products)
     review_counts = np.clip(review_counts, 0, 1000)
     
     # Generate inventory levels
-    inventory_levels = np.random.poisson(100, n_products)
+    inventory_levels = rng.poisson(100, n_products)
     inventory_levels = np.clip(inventory_levels, 0, 1000)
     
     # Create DataFrame
@@ -213,6 +245,81 @@ def generate_sample_product_data(n_products: int = 500) -> pd.DataFrame:
     return df
 
 
+def generate_all_sample_data(n_users: int = 1000, n_products: int = 500) -> Dict[str, pd.DataFrame]:
+    """
+    Generate all sample raw datasets concurrently
+    
+    Args:
+        n_users: Number of users to generate
+        n_products: Number of products to generate
+    
+    Returns:
+        Dictionary containing raw data DataFrames
+    """
+    # Each generator owns its seeded Generator, so the tables are independent and
+    # reproducible; the draws run in NumPy kernels, so threads are enough
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = {
+            'users': executor.submit(generate_sample_user_data, n_users),
+            'behavior': executor.submit(generate_sample_behavior_data, n_users),
+            'transactions': executor.submit(generate_sample_transaction_data, n_users),
+            'products': executor.submit(generate_sample_product_data, n_products),
+        }
+        return {name: future.result() for name, future in futures.items()}
+
+
+# Raw dataset names, also used as the Parquet file names in the raw data directory
+RAW_DATASETS = ['users', 'behavior', 'transactions', 'products']
+
+# CSV file name for each raw dataset
+RAW_CSV_FILES = {
+    'users': 'users.csv',
+    'behavior': 'user_behavior.csv',
+    'transactions': 'transactions.csv',
+    'products': 'products.csv',
+}
+
+# Timestamp columns in each raw CSV, parsed once at load time
+RAW_DATE_COLUMNS = {
+    'users': ['registration_date', 'event_timestamp'],
+    'behavior': ['last_session_date', 'event_timestamp'],
+    'transactions': ['last_purchase_date', 'event_timestamp'],
+    'products': ['event_timestamp'],
+}
+
+# Low-cardinality string columns in each raw dataset, stored as pandas 'category'
+RAW_CATEGORICAL_COLUMNS = {
+    'users': ['gender', 'location'],
+    'behavior': ['favorite_category'],
+    'transactions': ['favorite_payment_method'],
+    'products': ['category'],
+}
+
+
+def categorize_raw_data(raw_data: Dict[str, pd.DataFrame]) -> Dict[str, pd.DataFrame]:
+    """
+    Convert low-cardinality string columns to the 'category' dtype in place
+    
+    Comparisons, isin and groupby on these columns then work on integer codes
+    instead of Python string objects.
+    
+    Args:
+        raw_data: Dictionary containing raw data DataFrames
+    
+    Returns:
+        The same dictionary, for chaining
+    """
+    for name, columns in RAW_CATEGORICAL_COLUMNS.items():
+        df = raw_data.get(name)
+        if df is None:
+            continue
+        for column in columns:
+            if column in df.columns:
+                df[column] = df[column].astype('category')
+    
+    return raw_data
+
+
 def load_raw_data(data_dir: str = "data/raw") -> Dict[str, pd.DataFrame]:
     """
     Load raw data from files or generate sample data if files don't exist
@@ -225,12 +332,23 @@ def load_raw_data(data_dir: str = "data/raw") -> Dict[str, pd.DataFrame]:
     """
     raw_data = {}
     
+    # Prefer Parquet exports: typed columns, no text parsing
+    parquet_paths = {name: os.path.join(data_dir, f"{name}.parquet") for name in RAW_DATASETS}
+    if all(os.path.exists(path) for path in parquet_paths.values()):
+        for name, path in parquet_paths.items():
+            raw_data[name] = pd.read_parquet(path, engine="pyarrow")
+        
+        print("✅ Loaded existing raw data files (Parquet)")
+        return categorize_raw_data(raw_data)
+    
     try:
-        # Try to load existing files
-        raw_data['users'] = pd.read_csv(f"{data_dir}/users.csv")
-        raw_data['behavior'] = pd.read_csv(f"{data_dir}/user_behavior.csv")
-        raw_data['transactions'] = pd.read_csv(f"{data_dir}/transactions.csv")
-        raw_data['products'] = pd.read_csv(f"{data_dir}/products.csv")
+        # Try to load existing files with the multithreaded Arrow parser,
+        # parsing timestamps here rather than per feature set
+        for name, filename in RAW_CSV_FILES.items():
+            raw_data[name] = pd.read_csv(
+                os.path.join(data_dir, filename), engine="pyarrow",
+                parse_dates=RAW_DATE_COLUMNS[name], cache_dates=True
+            )
         
         print("✅ Loaded existing raw data files")
         
@@ -238,16 +356,66 @@ def load_raw_data(data_dir: str = "data/raw") -> Dict[str, pd.DataFrame]:
         # Generate sample data if files don't exist
         print("📊 Generating sample data...")
         
-        raw_data['users'] = generate_sample_user_data()
-        raw_data['behavior'] = generate_sample_behavior_data()
-        raw_data['transactions'] = generate_sample_transaction_data()
-        raw_data['products'] = generate_sample_product_data()
+        raw_data = generate_all_sample_data()
         
         print("✅ Generated sample data")
     
+    categorize_raw_data(raw_data)
+    
+    # Persist as Parquet so later runs skip CSV parsing and generation
+    cache_raw_data(raw_data, data_dir)
+    
     return raw_data
 
 
+def cache_raw_data(raw_data: Dict[str, pd.DataFrame], data_dir: str = "data/raw") -> bool:
+    """
+    Save raw data as Parquet files, which load_raw_data prefers over CSV
+    
+    Args:
+        raw_data: Dictionary containing raw data DataFrames
+        data_dir: Directory to save the Parquet files
+    
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    try:
+        os.makedirs(data_dir, exist_ok=True)
+        for name, df in raw_data.items():
+            df.to_parquet(
+                os.path.join(data_dir, f"{name}.parquet"),
+                engine="pyarrow", compression="zstd", index=False
+            )
+        
+        print(f"💾 Cached raw data as Parquet in {data_dir}")
+        return True
+        
+    except OSError as e:
+        print(f"⚠️ Warning: could not cache raw data: {e}")
+        return False
+
+
+# Entity key columns, used to detect duplicate rows without hashing every column
+ENTITY_KEY_COLUMNS = ['user_id', 'product_id']
+
+
+def count_duplicates(df: pd.DataFrame) -> int:
+    """
+    Count duplicate rows by entity key, falling back to full rows when there is no key
+    
+    Args:
+        df: DataFrame to check
+    
+    Returns:
+        Number of rows whose key (or full row) already appeared earlier
+    """
+    for key in ENTITY_KEY_COLUMNS:
+        if key in df.columns:
+            return int(df[key].duplicated().sum())
+    
+    return int(df.duplicated().sum())
+
+
 def validate_raw_data(raw_data: Dict[str, pd.DataFrame]) -> bool:
     """
     Validate raw data quality
@@ -262,13 +430,17 @@ def validate_raw_data(raw_data: Dict[str, pd.DataFrame]) -> bool:
         for name, df in raw_data.items():
             print(f"📋 Validating {name} data:")
             print(f"  - Shape: {df.shape}")
-            print(f"  - Missing values: {df.isnull().sum().sum()}")
-            print(f"  - Duplicates: {df.duplicated().sum()}")
             
-            if df.isnull().sum().sum() > 0:
+            # Scan once per check and reuse the counts for the warnings
+            missing_values = int(df.isnull().sum().sum())
+            duplicates = count_duplicates(df)
+            print(f"  - Missing values: {missing_values}")
+            print(f"  - Duplicates: {duplicates}")
+            
+            if missing_values > 0:
                 print(f"⚠️ Warning: {name} has missing values")
             
-            if df.duplicated().sum() > 0:
+            if duplicates > 0:
                 print(f"⚠️ Warning: {name} has duplicate rows")
         
         return True
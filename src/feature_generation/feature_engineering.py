@@ -7,268 +7,382 @@ into features suitable for ML models.
 
 import pandas as pd
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 
+from .data_loader import count_duplicates, days_since
 
-def engineer_user_demographic_features(users_df: pd.DataFrame) -> pd.DataFrame:
+
+# Bin edges and labels for the categorical features (right-closed intervals, as pd.cut)
+FEATURE_BINS = {
+    'age_group': (np.array([0, 25, 35, 45, 55, 100]), ['18-25', '26-35', '36-45', '46-55', '55+']),
+    'session_frequency': (np.array([0, 5, 15, 30, 1000]), ['Low', 'Medium', 'High', 'Very High']),
+    'session_duration_category': (np.array([0, 15, 30, 60, 1000]), ['Short', 'Medium', 'Long', 'Very Long']),
+    'engagement_level': (np.array([0, 25, 50, 75, 100]), ['Low', 'Medium', 'High', 'Very High']),
+    'activity_recency': (np.array([0, 1, 7, 30, 1000]), ['Very Recent', 'Recent', 'Moderate', 'Inactive']),
+    'spending_level': (np.array([0, 100, 500, 1000, 10000]), ['Low', 'Medium', 'High', 'Very High']),
+    'order_frequency': (np.array([0, 2, 5, 10, 1000]), ['Low', 'Medium', 'High', 'Very High']),
+    'purchase_recency': (np.array([0, 7, 30, 90, 1000]), ['Very Recent', 'Recent', 'Moderate', 'Inactive']),
+    'customer_value': (np.array([0, 200, 1000, 5000, 100000]), ['Bronze', 'Silver', 'Gold', 'Platinum']),
+    'price_category': (np.array([0, 20, 50, 100, 1000]), ['Budget', 'Mid-range', 'Premium', 'Luxury']),
+    'rating_category': (np.array([0, 3, 4, 4.5, 5]), ['Poor', 'Good', 'Very Good', 'Excellent']),
+    'review_volume': (np.array([0, 10, 50, 200, 10000]), ['Low', 'Medium', 'High', 'Very High']),
+    'inventory_status': (np.array([0, 10, 50, 200, 10000]), ['Low Stock', 'Medium Stock', 'High Stock', 'Overstocked']),
+    'popularity_level': (np.array([0, 2, 3, 4, 5]), ['Low', 'Medium', 'High', 'Very High']),
+}
+
+
+# Compact dtypes per feature set, applied to whichever of these columns are present.
+# Floats match the Float32 fields declared in the Feast feature views; Feast Int64
+# fields stay int64, only derived demo columns use narrower integers.
+FEATURE_DTYPES = {
+    'user_demographic': {
+        'user_tenure_days': 'int16', 'registration_month': 'int8', 'registration_day_of_week': 'int8'
+    },
+    'user_behavior': {'avg_session_duration': 'float32', 'engagement_score': 'float32'},
+    'transaction': {'total_spent': 'float32', 'avg_order_value': 'float32', 'clv_estimate': 'float32'},
+    'product': {'price': 'float32', 'avg_rating': 'float32', 'popularity_score': 'float32'},
+}
+
+MAJOR_CITIES = ['New York', 'Los Angeles', 'Chicago', 'Houston', 'Phoenix']
+
+# Category order for each integer encoding; the code is the 1-based position
+FEATURE_ENCODINGS = {
+    'gender_encoded': ['M', 'F', 'Other'],
+    'favorite_category_encoded': ['Electronics', 'Clothing', 'Books', 'Home', 'Sports'],
+    'payment_method_encoded': ['Credit Card', 'Debit Card', 'PayPal', 'Apple Pay', 'Google Pay'],
+    'category_encoded': [
+        'Electronics', 'Clothing', 'Books', 'Home', 'Sports',
+        'Beauty', 'Toys', 'Automotive', 'Health', 'Garden'
+    ],
+}
+
+
+def encode_categories(values, categories: List[str]) -> np.ndarray:
+    """
+    Encode values as 1-based positions in categories (0 for unknown values)
+    
+    Uses Categorical codes (a C-level lookup returning int8) instead of a per-row dict map.
+    
+    Args:
+        values: Values to encode
+        categories: Known categories in encoding order
+    
+    Returns:
+        int8 array of codes
+    """
+    return (pd.Categorical(values, categories=categories).codes + 1).astype(np.int8)
+
+
+def fast_cut(values, bins: np.ndarray, labels: List[str]) -> pd.Categorical:
+    """
+    Bin values into labelled right-closed intervals, equivalent to pd.cut(values, bins, labels=labels)
+    
+    Uses a single np.searchsorted over the bin edges instead of building an IntervalIndex.
+    Values outside (bins[0], bins[-1]] and NaNs map to NaN, as with pd.cut.
+    
+    Args:
+        values: Values to bin
+        bins: Monotonically increasing bin edges
+        labels: Labels for the len(bins) - 1 intervals
+    
+    Returns:
+        Ordered Categorical of bin labels
+    """
+    codes = np.searchsorted(bins, np.asarray(values, dtype=float), side='left') - 1
+    codes[codes >= len(labels)] = -1
+    return pd.Categorical.from_codes(codes, categories=labels, ordered=True)
+
+
+def downcast_features(features: pd.DataFrame, feature_set: str) -> pd.DataFrame:
+    """
+    Cast a feature set's columns to the compact dtypes listed in FEATURE_DTYPES
+    
+    Args:
+        features: Feature DataFrame
+        feature_set: Feature set name (key of FEATURE_DTYPES)
+    
+    Returns:
+        DataFrame with downcast columns
+    """
+    dtypes = {
+        column: dtype for column, dtype in FEATURE_DTYPES[feature_set].items()
+        if column in features.columns
+    }
+    return features.astype(dtypes)
+
+
+def month_of_year(timestamps) -> np.ndarray:
+    """
+    Calendar month (1-12) of each timestamp, same as .dt.month
+    
+    Args:
+        timestamps: Datetime values
+    
+    Returns:
+        int8 array of months
+    """
+    months_since_epoch = np.asarray(timestamps, dtype='datetime64[M]').view('i8')
+    return (months_since_epoch % 12 + 1).astype(np.int8)
+
+
+def day_of_week(timestamps) -> np.ndarray:
+    """
+    Day of week (Monday=0 ... Sunday=6) of each timestamp, same as .dt.dayofweek
+    
+    Args:
+        timestamps: Datetime values
+    
+    Returns:
+        int8 array of weekdays
+    """
+    days_since_epoch = np.asarray(timestamps, dtype='datetime64[D]').view('i8')
+    # 1970-01-01 was a Thursday (3)
+    return ((days_since_epoch + 3) % 7).astype(np.int8)
+
+
+def is_major_city(locations) -> np.ndarray:
+    """
+    Flag locations that are one of MAJOR_CITIES, equivalent to locations.isin(MAJOR_CITIES)
+    
+    Membership is decided once per category and then gathered by category code,
+    so rows are never hashed (free when the column is already categorical).
+    
+    Args:
+        locations: Location values
+    
+    Returns:
+        Boolean array
+    """
+    locations = pd.Categorical(locations)
+    # Trailing False is picked up by code -1 (missing values)
+    lookup = np.append(np.isin(locations.categories, MAJOR_CITIES), False)
+    return lookup[locations.codes]
+
+
+def popularity_score(avg_rating, total_reviews, price) -> np.ndarray:
+    """
+    Product popularity: rating * 0.4 + log1p(reviews) * 0.3 + 1 / (1 + price / 100) * 0.3
+    
+    Evaluated in place with ufunc out= arguments, so only two arrays are allocated
+    instead of one temporary per operation.
+    
+    Args:
+        avg_rating: Average product ratings
+        total_reviews: Review counts
+        price: Product prices
+    
+    Returns:
+        float64 array of popularity scores
+    """
+    score = np.multiply(np.asarray(avg_rating, dtype=float), 0.4)
+    
+    term = np.log1p(np.asarray(total_reviews, dtype=float))
+    term *= 0.3
+    score += term
+    
+    np.divide(np.asarray(price, dtype=float), 100, out=term)
+    term += 1
+    np.reciprocal(term, out=term)
+    term *= 0.3
+    score += term
+    
+    return score
+
+
+def engineer_user_demographic_features(users_df: pd.DataFrame, return_all: bool = False) -> pd.DataFrame:
     """
     Engineer user demographic features
     
     Args:
         users_df: Raw user data DataFrame
+        return_all: Keep every derived column instead of only the feature store subset
     
     Returns:
         DataFrame with engineered demographic features
     """
-    print("🔧 Engineering user demographic features...")
-    
-    # Create a copy to avoid modifying original data
-    features = users_df.copy()
+    # Shallow copy: new and reassigned columns land on the copy, the input's arrays are shared
+    features = users_df.copy(deep=False)
     
     # Convert registration_date to datetime if it's a string
     if features['registration_date'].dtype == 'object':
         features['registration_date'] = pd.to_datetime(features['registration_date'])
     
     # Calculate user tenure (days since registration)
-    features['user_tenure_days'] = (
-        datetime.now() - features['registration_date']
-    ).dt.days
+    features['user_tenure_days'] = days_since(features['registration_date'], datetime.now())
     
     # Create age groups
-    features['age_group'] = pd.cut(
-        features['age'],
-        bins=[0, 25, 35, 45, 55, 100],
-        labels=['18-25', '26-35', '36-45', '46-55', '55+']
-    )
+    features['age_group'] = fast_cut(features['age'], *FEATURE_BINS['age_group'])
     
     # Create location groups (major cities vs others)
-    major_cities = ['New York', 'Los Angeles', 'Chicago', 'Houston', 'Phoenix']
-    features['is_major_city'] = features['location'].isin(major_cities)
+    features['is_major_city'] = is_major_city(features['location'])
     
     # Create gender encoding
-    features['gender_encoded'] = features['gender'].map({'M': 1, 'F': 2, 'Other': 3})
+    features['gender_encoded'] = encode_categories(features['gender'], FEATURE_ENCODINGS['gender_encoded'])
     
     # Calculate registration month and day of week
-    features['registration_month'] = features['registration_date'].dt.month
-    features['registration_day_of_week'] = features['registration_date'].dt.dayofweek
+    features['registration_month'] = month_of_year(features['registration_date'])
+    features['registration_day_of_week'] = day_of_week(features['registration_date'])
     
     # Create premium user flag
     features['is_premium'] = features['is_premium'].astype(int)
     
-    # Select final features for feature store
-    final_features = features[[
+    # Select final features for feature store (the demo keeps every derived column)
+    final_features = features if return_all else features[[
         'user_id', 'age', 'gender', 'location', 'registration_date',
         'is_premium', 'event_timestamp'
-    ]].copy()
+    ]]
+    final_features = downcast_features(final_features, 'user_demographic')
     
-    print(f"✅ Engineered {len(final_features)} user demographic features")
     return final_features
 
 
-def engineer_user_behavior_features(behavior_df: pd.DataFrame) -> pd.DataFrame:
+def engineer_user_behavior_features(behavior_df: pd.DataFrame, return_all: bool = False) -> pd.DataFrame:
     """
     Engineer user behavior features
     
     Args:
         behavior_df: Raw user behavior data DataFrame
+        return_all: Keep every derived column instead of only the feature store subset
     
     Returns:
         DataFrame with engineered behavior features
     """
-    print("🔧 Engineering user behavior features...")
-    
-    # Create a copy to avoid modifying original data
-    features = behavior_df.copy()
+    # Shallow copy: new and reassigned columns land on the copy, the input's arrays are shared
+    features = behavior_df.copy(deep=False)
     
     # Convert session date to datetime if it's a string
     if 'last_session_date' in features.columns and features['last_session_date'].dtype == 'object':
         features['last_session_date'] = pd.to_datetime(features['last_session_date'])
     
     # Create session frequency categories
-    features['session_frequency'] = pd.cut(
-        features['total_sessions'],
-        bins=[0, 5, 15, 30, 1000],
-        labels=['Low', 'Medium', 'High', 'Very High']
-    )
+    features['session_frequency'] = fast_cut(features['total_sessions'], *FEATURE_BINS['session_frequency'])
     
     # Create session duration categories
-    features['session_duration_category'] = pd.cut(
-        features['avg_session_duration'],
-        bins=[0, 15, 30, 60, 1000],
-        labels=['Short', 'Medium', 'Long', 'Very Long']
-    )
+    features['session_duration_category'] = fast_cut(features['avg_session_duration'], *FEATURE_BINS['session_duration_category'])
     
     # Create engagement level based on engagement score
-    features['engagement_level'] = pd.cut(
-        features['engagement_score'],
-        bins=[0, 25, 50, 75, 100],
-        labels=['Low', 'Medium', 'High', 'Very High']
-    )
+    features['engagement_level'] = fast_cut(features['engagement_score'], *FEATURE_BINS['engagement_level'])
     
     # Create activity recency categories
-    features['activity_recency'] = pd.cut(
-        features['last_login_days'],
-        bins=[0, 1, 7, 30, 1000],
-        labels=['Very Recent', 'Recent', 'Moderate', 'Inactive']
-    )
+    features['activity_recency'] = fast_cut(features['last_login_days'], *FEATURE_BINS['activity_recency'])
     
     # Create favorite category encoding
-    category_mapping = {
-        'Electronics': 1, 'Clothing': 2, 'Books': 3, 'Home': 4, 'Sports': 5
-    }
-    features['favorite_category_encoded'] = features['favorite_category'].map(category_mapping)
+    features['favorite_category_encoded'] = encode_categories(features['favorite_category'], FEATURE_ENCODINGS['favorite_category_encoded'])
     
-    # Select final features for feature store
-    final_features = features[[
+    # Select final features for feature store (the demo keeps every derived column)
+    final_features = features if return_all else features[[
         'user_id', 'avg_session_duration', 'total_sessions', 'favorite_category',
         'last_login_days', 'engagement_score', 'event_timestamp'
-    ]].copy()
+    ]]
+    final_features = downcast_features(final_features, 'user_behavior')
     
-    print(f"✅ Engineered {len(final_features)} user behavior features")
     return final_features
 
 
-def engineer_transaction_features(transactions_df: pd.DataFrame) -> pd.DataFrame:
+def engineer_transaction_features(transactions_df: pd.DataFrame, return_all: bool = False) -> pd.DataFrame:
     """
     Engineer transaction features
     
     Args:
         transactions_df: Raw transaction data DataFrame
+        return_all: Keep every derived column instead of only the feature store subset
     
     Returns:
         DataFrame with engineered transaction features
     """
-    print("🔧 Engineering transaction features...")
-    
-    # Create a copy to avoid modifying original data
-    features = transactions_df.copy()
+    # Shallow copy: new and reassigned columns land on the copy, the input's arrays are shared
+    features = transactions_df.copy(deep=False)
     
     # Convert purchase date to datetime if it's a string
     if 'last_purchase_date' in features.columns and features['last_purchase_date'].dtype == 'object':
         features['last_purchase_date'] = pd.to_datetime(features['last_purchase_date'])
     
     # Create spending categories
-    features['spending_level'] = pd.cut(
-        features['total_spent'],
-        bins=[0, 100, 500, 1000, 10000],
-        labels=['Low', 'Medium', 'High', 'Very High']
-    )
+    features['spending_level'] = fast_cut(features['total_spent'], *FEATURE_BINS['spending_level'])
     
     # Create order frequency categories
-    features['order_frequency'] = pd.cut(
-        features['total_orders'],
-        bins=[0, 2, 5, 10, 1000],
-        labels=['Low', 'Medium', 'High', 'Very High']
-    )
+    features['order_frequency'] = fast_cut(features['total_orders'], *FEATURE_BINS['order_frequency'])
     
     # Create purchase recency categories
-    features['purchase_recency'] = pd.cut(
-        features['last_purchase_days'],
-        bins=[0, 7, 30, 90, 1000],
-        labels=['Very Recent', 'Recent', 'Moderate', 'Inactive']
-    )
+    features['purchase_recency'] = fast_cut(features['last_purchase_days'], *FEATURE_BINS['purchase_recency'])
     
     # Create payment method encoding
-    payment_mapping = {
-        'Credit Card': 1, 'Debit Card': 2, 'PayPal': 3, 'Apple Pay': 4, 'Google Pay': 5
-    }
-    features['payment_method_encoded'] = features['favorite_payment_method'].map(payment_mapping)
+    features['payment_method_encoded'] = encode_categories(features['favorite_payment_method'], FEATURE_ENCODINGS['payment_method_encoded'])
     
     # Calculate customer lifetime value (CLV) approximation
     features['clv_estimate'] = features['total_spent'] * (1 + features['total_orders'] * 0.1)
     
     # Create customer value categories
-    features['customer_value'] = pd.cut(
-        features['clv_estimate'],
-        bins=[0, 200, 1000, 5000, 100000],
-        labels=['Bronze', 'Silver', 'Gold', 'Platinum']
-    )
+    features['customer_value'] = fast_cut(features['clv_estimate'], *FEATURE_BINS['customer_value'])
     
-    # Select final features for feature store
-    final_features = features[[
+    # Select final features for feature store (the demo keeps every derived column)
+    final_features = features if return_all else features[[
         'user_id', 'total_spent', 'avg_order_value', 'total_orders',
         'last_purchase_days', 'favorite_payment_method', 'event_timestamp'
-    ]].copy()
+    ]]
+    final_features = downcast_features(final_features, 'transaction')
     
-    print(f"✅ Engineered {len(final_features)} transaction features")
     return final_features
 
 
-def engineer_product_features(products_df: pd.DataFrame) -> pd.DataFrame:
+def engineer_product_features(products_df: pd.DataFrame, return_all: bool = False) -> pd.DataFrame:
     """
     Engineer product features
     
     Args:
         products_df: Raw product data DataFrame
+        return_all: Keep every derived column instead of only the feature store subset
     
     Returns:
         DataFrame with engineered product features
     """
-    print("🔧 Engineering product features...")
-    
-    # Create a copy to avoid modifying original data
-    features = products_df.copy()
+    # Shallow copy: new and reassigned columns land on the copy, the input's arrays are shared
+    features = products_df.copy(deep=False)
     
     # Create price categories
-    features['price_category'] = pd.cut(
-        features['price'],
-        bins=[0, 20, 50, 100, 1000],
-        labels=['Budget', 'Mid-range', 'Premium', 'Luxury']
-    )
+    features['price_category'] = fast_cut(features['price'], *FEATURE_BINS['price_category'])
     
     # Create rating categories
-    features['rating_category'] = pd.cut(
-        features['avg_rating'],
-        bins=[0, 3, 4, 4.5, 5],
-        labels=['Poor', 'Good', 'Very Good', 'Excellent']
-    )
+    features['rating_category'] = fast_cut(features['avg_rating'], *FEATURE_BINS['rating_category'])
     
     # Create review volume categories
-    features['review_volume'] = pd.cut(
-        features['total_reviews'],
-        bins=[0, 10, 50, 200, 10000],
-        labels=['Low', 'Medium', 'High', 'Very High']
-    )
+    features['review_volume'] = fast_cut(features['total_reviews'], *FEATURE_BINS['review_volume'])
     
     # Create inventory status
-    features['inventory_status'] = pd.cut(
-        features['inventory_level'],
-        bins=[0, 10, 50, 200, 10000],
-        labels=['Low Stock', 'Medium Stock', 'High Stock', 'Overstocked']
-    )
+    features['inventory_status'] = fast_cut(features['inventory_level'], *FEATURE_BINS['inventory_status'])
     
     # Create category encoding
-    category_mapping = {
-        'Electronics': 1, 'Clothing': 2, 'Books': 3, 'Home': 4, 'Sports': 5,
-        'Beauty': 6, 'Toys': 7, 'Automotive': 8, 'Health': 9, 'Garden': 10
-    }
-    features['category_encoded'] = features['category'].map(category_mapping)
+    features['category_encoded'] = encode_categories(features['category'], FEATURE_ENCODINGS['category_encoded'])
     
     # Calculate popularity score
-    features['popularity_score'] = (
-        features['avg_rating'] * 0.4 +
-        np.log1p(features['total_reviews']) * 0.3 +
-        (1 / (1 + features['price'] / 100)) * 0.3
+    features['popularity_score'] = popularity_score(
+        features['avg_rating'], features['total_reviews'], features['price']
     )
     
     # Create popularity categories
-    features['popularity_level'] = pd.cut(
-        features['popularity_score'],
-        bins=[0, 2, 3, 4, 5],
-        labels=['Low', 'Medium', 'High', 'Very High']
-    )
+    features['popularity_level'] = fast_cut(features['popularity_score'], *FEATURE_BINS['popularity_level'])
     
-    # Select final features for feature store
-    final_features = features[[
+    # Select final features for feature store (the demo keeps every derived column)
+    final_features = features if return_all else features[[
         'product_id', 'category', 'price', 'avg_rating', 'total_reviews',
         'inventory_level', 'event_timestamp'
-    ]].copy()
+    ]]
+    final_features = downcast_features(final_features, 'product')
     
-    print(f"✅ Engineered {len(final_features)} product features")
     return final_features
 
 
+# (feature set name, raw data key, engineer function), in output order
+ENGINEERING_STEPS = [
+    ('user_demographic', 'users', engineer_user_demographic_features),
+    ('user_behavior', 'behavior', engineer_user_behavior_features),
+    ('transaction', 'transactions', engineer_transaction_features),
+    ('product', 'products', engineer_product_features),
+]
+
+
 def engineer_all_features(raw_data: Dict[str, pd.DataFrame]) -> Dict[str, pd.DataFrame]:
     """
     Engineer all features from raw data
@@ -281,23 +395,26 @@ def engineer_all_features(raw_data: Dict[str, pd.DataFrame]) -> Dict[str, pd.Dat
     """
     print("🚀 Starting feature engineering pipeline...")
     
-    engineered_features = {}
-    
-    # Engineer user demographic features
-    if 'users' in raw_data:
-        engineered_features['user_demographic'] = engineer_user_demographic_features(raw_data['users'])
+    steps = [
+        (name, raw_key, engineer) for name, raw_key, engineer in ENGINEERING_STEPS
+        if raw_key in raw_data
+    ]
     
-    # Engineer user behavior features
-    if 'behavior' in raw_data:
-        engineered_features['user_behavior'] = engineer_user_behavior_features(raw_data['behavior'])
+    # The tables are independent and the work runs in NumPy/pandas kernels that
+    # release the GIL, so threads are enough to engineer them concurrently.
+    # Progress is printed here, in step order, so the workers' output cannot interleave.
+    for name, _, _ in steps:
+        print(f"🔧 Engineering {name.replace('_', ' ')} features...")
     
-    # Engineer transaction features
-    if 'transactions' in raw_data:
-        engineered_features['transaction'] = engineer_transaction_features(raw_data['transactions'])
-    
-    # Engineer product features
-    if 'products' in raw_data:
-        engineered_features['product'] = engineer_product_features(raw_data['products'])
+    engineered_features = {}
+    with ThreadPoolExecutor(max_workers=max(len(steps), 1)) as executor:
+        futures = {
+            name: executor.submit(engineer, raw_data[raw_key])
+            for name, raw_key, engineer in steps
+        }
+        for name, future in futures.items():
+            engineered_features[name] = future.result()
+            print(f"✅ Engineered {len(engineered_features[name])} {name.replace('_', ' ')} features")
     
     print("✅ Feature engineering pipeline completed!")
     
@@ -314,53 +431,11 @@ def engineer_all_features_for_demo(raw_data: Dict[str, pd.DataFrame]) -> Dict[st
     """
     print("🚀 Starting feature engineering pipeline for demo...")
     engineered_features = {}
-    # User Demographic
-    if 'users' in raw_data:
-        features = raw_data['users'].copy()
-        if features['registration_date'].dtype == 'object':
-            features['registration_date'] = pd.to_datetime(features['registration_date'])
-        features['user_tenure_days'] = (datetime.now() - features['registration_date']).dt.days
-        features['age_group'] = pd.cut(features['age'], bins=[0, 25, 35, 45, 55, 100], labels=['18-25', '26-35', '36-45', '46-55', '55+'])
-        major_cities = ['New York', 'Los Angeles', 'Chicago', 'Houston', 'Phoenix']
-        features['is_major_city'] = features['location'].isin(major_cities)
-        features['gender_encoded'] = features['gender'].map({'M': 1, 'F': 2, 'Other': 3})
-        features['registration_month'] = features['registration_date'].dt.month
-        features['registration_day_of_week'] = features['registration_date'].dt.dayofweek
-        features['is_premium'] = features['is_premium'].astype(int)
-        engineered_features['user_demographic'] = features.copy()
-    # User Behavior
-    if 'behavior' in raw_data:
-        features = raw_data['behavior'].copy()
-        features['session_frequency'] = pd.cut(features['total_sessions'], bins=[0, 5, 15, 30, 1000], labels=['Low', 'Medium', 'High', 'Very High'])
-        features['session_duration_category'] = pd.cut(features['avg_session_duration'], bins=[0, 15, 30, 60, 1000], labels=['Short', 'Medium', 'Long', 'Very Long'])
-        features['engagement_level'] = pd.cut(features['engagement_score'], bins=[0, 25, 50, 75, 100], labels=['Low', 'Medium', 'High', 'Very High'])
-        features['activity_recency'] = pd.cut(features['last_login_days'], bins=[0, 1, 7, 30, 1000], labels=['Very Recent', 'Recent', 'Moderate', 'Inactive'])
-        category_mapping = {'Electronics': 1, 'Clothing': 2, 'Books': 3, 'Home': 4, 'Sports': 5}
-        features['favorite_category_encoded'] = features['favorite_category'].map(category_mapping)
-        engineered_features['user_behavior'] = features.copy()
-    # Transaction
-    if 'transactions' in raw_data:
-        features = raw_data['transactions'].copy()
-        features['spending_level'] = pd.cut(features['total_spent'], bins=[0, 100, 500, 1000, 10000], labels=['Low', 'Medium', 'High', 'Very High'])
-        features['order_frequency'] = pd.cut(features['total_orders'], bins=[0, 2, 5, 10, 1000], labels=['Low', 'Medium', 'High', 'Very High'])
-        features['purchase_recency'] = pd.cut(features['last_purchase_days'], bins=[0, 7, 30, 90, 1000], labels=['Very Recent', 'Recent', 'Moderate', 'Inactive'])
-        payment_mapping = {'Credit Card': 1, 'Debit Card': 2, 'PayPal': 3, 'Apple Pay': 4, 'Google Pay': 5}
-        features['payment_method_encoded'] = features['favorite_payment_method'].map(payment_mapping)
-        features['clv_estimate'] = features['total_spent'] * (1 + features['total_orders'] * 0.1)
-        features['customer_value'] = pd.cut(features['clv_estimate'], bins=[0, 200, 1000, 5000, 100000], labels=['Bronze', 'Silver', 'Gold', 'Platinum'])
-        engineered_features['transaction'] = features.copy()
-    # Product
-    if 'products' in raw_data:
-        features = raw_data['products'].copy()
-        features['price_category'] = pd.cut(features['price'], bins=[0, 20, 50, 100, 1000], labels=['Budget', 'Mid-range', 'Premium', 'Luxury'])
-        features['rating_category'] = pd.cut(features['avg_rating'], bins=[0, 3, 4, 4.5, 5], labels=['Poor', 'Good', 'Very Good', 'Excellent'])
-        features['review_volume'] = pd.cut(features['total_reviews'], bins=[0, 10, 50, 200, 10000], labels=['Low', 'Medium', 'High', 'Very High'])
-        features['inventory_status'] = pd.cut(features['inventory_level'], bins=[0, 10, 50, 200, 10000], labels=['Low Stock', 'Medium Stock', 'High Stock', 'Overstocked'])
-        category_mapping = {'Electronics': 1, 'Clothing': 2, 'Books': 3, 'Home': 4, 'Sports': 5, 'Beauty': 6, 'Toys': 7, 'Automotive': 8, 'Health': 9, 'Garden': 10}
-        features['category_encoded'] = features['category'].map(category_mapping)
-        features['popularity_score'] = (features['avg_rating'] * 0.4 + np.log1p(features['total_reviews']) * 0.3 + (1 / (1 + features['price'] / 100)) * 0.3)
-        features['popularity_level'] = pd.cut(features['popularity_score'], bins=[0, 2, 3, 4, 5], labels=['Low', 'Medium', 'High', 'Very High'])
-        engineered_features['product'] = features.copy()
+    for name, raw_key, engineer in ENGINEERING_STEPS:
+        if raw_key in raw_data:
+            print(f"🔧 Engineering {name.replace('_', ' ')} features...")
+            engineered_features[name] = engineer(raw_data[raw_key], return_all=True)
+            print(f"✅ Engineered {len(engineered_features[name])} {name.replace('_', ' ')} features")
     print("✅ Feature engineering pipeline for demo completed!")
     return engineered_features
 
@@ -379,8 +454,12 @@ def validate_engineered_features(engineered_features: Dict[str, pd.DataFrame]) -
         for name, df in engineered_features.items():
             print(f"📋 Validating {name} features:")
             print(f"  - Shape: {df.shape}")
-            print(f"  - Missing values: {df.isnull().sum().sum()}")
-            print(f"  - Duplicates: {df.duplicated().sum()}")
+            
+            # Scan once per check and reuse the counts for the warnings
+            missing_values = int(df.isnull().sum().sum())
+            duplicates = count_duplicates(df)
+            print(f"  - Missing values: {missing_values}")
+            print(f"  - Duplicates: {duplicates}")
             
             # Check for required columns
             required_cols = ['event_timestamp']
@@ -394,10 +473,10 @@ def validate_engineered_features(engineered_features: Dict[str, pd.DataFrame]) -
                 print(f"❌ Missing required columns: {missing_cols}")
                 return False
             
-            if df.isnull().sum().sum() > 0:
+            if missing_values > 0:
                 print(f"⚠️ Warning: {name} has missing values")
             
-            if df.duplicated().sum() > 0:
+            if duplicates > 0:
                 print(f"⚠️ Warning: {name} has duplicate rows")
         
         return True
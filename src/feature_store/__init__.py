@@ -5,15 +5,52 @@ This module contains all feature store related functionality including:
 - Feature definitions
 - Feature registration
 - Feature metadata management
+
+Submodules pull in Feast (and pandas with it), so public names are resolved
+lazily on first access instead of at package import time.
 """
 
-from .entities import *
-from .feature_views import *
-from .feature_services import *
-from .registry import *
+import importlib
+
+# Public name -> submodule that defines it
+LAZY_ATTRIBUTES = {
+    'get_user_entity': '.entities',
+    'get_product_entity': '.entities',
+    'get_all_entities': '.entities',
+    'get_user_demographic_features': '.feature_views',
+    'get_user_behavior_features': '.feature_views',
+    'get_transaction_features': '.feature_views',
+    'get_product_features': '.feature_views',
+    'get_all_feature_views': '.feature_views',
+    'get_user_feature_service': '.feature_services',
+    'get_product_feature_service': '.feature_services',
+    'get_behavior_feature_service': '.feature_services',
+    'get_all_feature_services': '.feature_services',
+    'get_feature_store': '.registry',
+    'register_all_features': '.registry',
+    'validate_feature_store': '.registry',
+    'export_metadata': '.registry',
+    'list_registered_features': '.registry',
+    'load_feature_service_vectors': '.registry',
+    'get_feature_service_references': '.registry',
+}
 
 __all__ = [
     'register_all_features',
     'get_feature_store',
     'export_metadata'
-] 
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    if name in LAZY_ATTRIBUTES:
+        module = importlib.import_module(LAZY_ATTRIBUTES[name], __name__)
+        value = getattr(module, name)
+        # Cache on the package so later lookups skip __getattr__
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(LAZY_ATTRIBUTES))
@@ -1,94 +1,142 @@
 """
 Data Source Definitions for Feast Feature Store
 
-This module contains all data source definitions including local CSV files and S3 placeholders.
+This module contains all data source definitions including local Parquet files and S3 placeholders.
 """
 
-from feast import FileSource
+from __future__ import annotations
 
+import os
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
+# Feast is imported inside each factory so importing this module stays cheap
+if TYPE_CHECKING:
+    from feast import FileSource
+
+
+# Custom S3 endpoint (e.g. MinIO); when set, Feast reads S3 sources through pyarrow's S3FileSystem
+S3_ENDPOINT_OVERRIDE = os.environ.get("S3_ENDPOINT_OVERRIDE")
+
+
+@lru_cache(maxsize=None)
 def get_user_demographic_source() -> FileSource:
     """Get user demographic data source"""
+    from feast import FileSource
+    from feast.data_format import ParquetFormat
     return FileSource(
         name="user_demographic_source",
-        path="data/transformed/user_demographic_features.csv",
+        path="data/transformed/user_demographic_features.parquet",
+        file_format=ParquetFormat(),
         timestamp_field="event_timestamp",
-        description="User demographic features from local CSV data. Contains age, gender, location, and subscription status."
+        description="User demographic features from local Parquet data. Contains age, gender, location, and subscription status."
     )
 
 
+@lru_cache(maxsize=None)
 def get_user_behavior_source() -> FileSource:
     """Get user behavior data source"""
+    from feast import FileSource
+    from feast.data_format import ParquetFormat
     return FileSource(
         name="user_behavior_source",
-        path="data/transformed/user_behavior_features.csv",
+        path="data/transformed/user_behavior_features.parquet",
+        file_format=ParquetFormat(),
         timestamp_field="event_timestamp",
-        description="User behavior features from local CSV data. Contains session metrics and engagement scores."
+        description="User behavior features from local Parquet data. Contains session metrics and engagement scores."
     )
 
 
+@lru_cache(maxsize=None)
 def get_transaction_source() -> FileSource:
     """Get transaction data source"""
+    from feast import FileSource
+    from feast.data_format import ParquetFormat
     return FileSource(
         name="transaction_source",
-        path="data/transformed/transaction_features.csv",
+        path="data/transformed/transaction_features.parquet",
+        file_format=ParquetFormat(),
         timestamp_field="event_timestamp",
-        description="Transaction features from local CSV data. Contains purchase history and payment information."
+        description="Transaction features from local Parquet data. Contains purchase history and payment information."
     )
 
 
+@lru_cache(maxsize=None)
 def get_product_source() -> FileSource:
     """Get product data source"""
+    from feast import FileSource
+    from feast.data_format import ParquetFormat
     return FileSource(
         name="product_source",
-        path="data/transformed/product_features.csv",
+        path="data/transformed/product_features.parquet",
+        file_format=ParquetFormat(),
         timestamp_field="event_timestamp",
-        description="Product features from local CSV data. Contains product metadata and performance metrics."
+        description="Product features from local Parquet data. Contains product metadata and performance metrics."
     )
 
 
+@lru_cache(maxsize=None)
 def get_s3_user_demographic_source() -> FileSource:
     """Get S3 placeholder for user demographic data source"""
+    from feast import FileSource
+    from feast.data_format import ParquetFormat
     return FileSource(
         name="user_demographic_source",
         path="s3://your-bucket/features/user_demographic_features.parquet",
+        file_format=ParquetFormat(),
+        s3_endpoint_override=S3_ENDPOINT_OVERRIDE,
         timestamp_field="event_timestamp",
         description="User demographic features stored in S3. Contains age, gender, location, and subscription status."
     )
 
 
+@lru_cache(maxsize=None)
 def get_s3_user_behavior_source() -> FileSource:
     """Get S3 placeholder for user behavior data source"""
+    from feast import FileSource
+    from feast.data_format import ParquetFormat
     return FileSource(
         name="user_behavior_source",
         path="s3://your-bucket/features/user_behavior_features.parquet",
+        file_format=ParquetFormat(),
+        s3_endpoint_override=S3_ENDPOINT_OVERRIDE,
         timestamp_field="event_timestamp",
         description="User behavior features stored in S3. Contains session metrics and engagement scores."
     )
 
 
+@lru_cache(maxsize=None)
 def get_s3_transaction_source() -> FileSource:
     """Get S3 placeholder for transaction data source"""
+    from feast import FileSource
+    from feast.data_format import ParquetFormat
     return FileSource(
         name="transaction_source",
         path="s3://your-bucket/features/transaction_features.parquet",
+        file_format=ParquetFormat(),
+        s3_endpoint_override=S3_ENDPOINT_OVERRIDE,
         timestamp_field="event_timestamp",
         description="Transaction features stored in S3. Contains purchase history and payment information."
     )
 
 
+@lru_cache(maxsize=None)
 def get_s3_product_source() -> FileSource:
     """Get S3 placeholder for product data source"""
+    from feast import FileSource
+    from feast.data_format import ParquetFormat
     return FileSource(
         name="product_source",
         path="s3://your-bucket/features/product_features.parquet",
+        file_format=ParquetFormat(),
+        s3_endpoint_override=S3_ENDPOINT_OVERRIDE,
         timestamp_field="event_timestamp",
         description="Product features stored in S3. Contains product metadata and performance metrics."
     )
 
 
 def get_all_local_sources():
-    """Get all local CSV data sources"""
+    """Get all local Parquet data sources"""
     return [
         get_user_demographic_source(),
         get_user_behavior_source(),
@@ -5,11 +5,20 @@ This module contains all entity definitions used across the feature store.
 Entities represent the primary keys for features.
 """
 
-from feast import Entity, ValueType
+from __future__ import annotations
 
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
+# Feast is imported inside each factory so importing this module stays cheap
+if TYPE_CHECKING:
+    from feast import Entity
+
+
+@lru_cache(maxsize=None)
 def get_user_entity() -> Entity:
     """Get user entity definition"""
+    from feast import Entity, ValueType
     return Entity(
         name="user_id",
         value_type=ValueType.INT64,
@@ -18,8 +27,10 @@ def get_user_entity() -> Entity:
     )
 
 
+@lru_cache(maxsize=None)
 def get_product_entity() -> Entity:
     """Get product entity definition"""
+    from feast import Entity, ValueType
     return Entity(
         name="product_id",
         value_type=ValueType.INT64,
@@ -5,16 +5,25 @@ This module contains all feature service definitions that group related features
 for easier consumption by ML models.
 """
 
-from feast import FeatureService
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
 from .feature_views import (
     get_user_demographic_features, get_user_behavior_features,
     get_transaction_features, get_product_features
 )
 
+# Feast is imported inside each factory so importing this module stays cheap
+if TYPE_CHECKING:
+    from feast import FeatureService
+
 
+@lru_cache(maxsize=None)
 def get_user_feature_service() -> FeatureService:
     """Get comprehensive user feature service"""
+    from feast import FeatureService
     return FeatureService(
         name="user_feature_service",
         features=[
@@ -33,8 +42,10 @@ def get_user_feature_service() -> FeatureService:
     )
 
 
+@lru_cache(maxsize=None)
 def get_product_feature_service() -> FeatureService:
     """Get product feature service"""
+    from feast import FeatureService
     return FeatureService(
         name="product_feature_service",
         features=[get_product_features()],
@@ -49,8 +60,10 @@ def get_product_feature_service() -> FeatureService:
     )
 
 
+@lru_cache(maxsize=None)
 def get_behavior_feature_service() -> FeatureService:
     """Get user behavior feature service"""
+    from feast import FeatureService
     return FeatureService(
         name="behavior_feature_service",
         features=[
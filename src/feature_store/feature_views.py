@@ -5,9 +5,11 @@ This module contains all feature view definitions with comprehensive metadata,
 GitHub links to code logic, and business descriptions.
 """
 
+from __future__ import annotations
+
 from datetime import timedelta
-from feast import FeatureView, Field
-from feast.types import Float32, Int64, String, Bool
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
 from .entities import get_user_entity, get_product_entity
 from .data_sources import (
@@ -15,9 +17,16 @@ from .data_sources import (
     get_transaction_source, get_product_source
 )
 
+# Feast is imported inside each factory so importing this module stays cheap
+if TYPE_CHECKING:
+    from feast import FeatureView
+
 
+@lru_cache(maxsize=None)
 def get_user_demographic_features() -> FeatureView:
     """Get user demographic feature view"""
+    from feast import FeatureView, Field
+    from feast.types import Int64, String, Bool
     return FeatureView(
         name="user_demographic_features",
         entities=[get_user_entity()],
@@ -31,10 +40,10 @@ def get_user_demographic_features() -> FeatureView:
         ],
         source=get_user_demographic_source(),
         description="""
-        User demographic features from local CSV data.
+        User demographic features from local Parquet data.
         
         **Code Logic:** https://github.com/your-username/fs_poc_2/blob/main/src/feature_generation/feature_engineering.py#L13
-        **Data Source:** Local CSV file: data/transformed/user_demographic_features.csv
+        **Data Source:** Local Parquet file: data/transformed/user_demographic_features.parquet
         **Update Frequency:** Daily
         **Business Use Cases:** User segmentation, personalized recommendations, marketing campaigns
         **Feature Generation Script:** https://github.com/your-username/fs_poc_2/blob/main/src/feature_generation/data_loader.py#L13
@@ -42,8 +51,11 @@ def get_user_demographic_features() -> FeatureView:
     )
 
 
+@lru_cache(maxsize=None)
 def get_user_behavior_features() -> FeatureView:
     """Get user behavior feature view"""
+    from feast import FeatureView, Field
+    from feast.types import Float32, Int64, String
     return FeatureView(
         name="user_behavior_features",
         entities=[get_user_entity()],
@@ -60,7 +72,7 @@ def get_user_behavior_features() -> FeatureView:
         User behavior features derived from session data and user interactions.
         
         **Code Logic:** https://github.com/your-username/fs_poc_2/blob/main/src/feature_generation/feature_engineering.py#L67
-        **Data Source:** Local CSV file: data/transformed/user_behavior_features.csv
+        **Data Source:** Local Parquet file: data/transformed/user_behavior_features.parquet
         **Update Frequency:** Hourly
         **Business Use Cases:** Churn prediction, engagement optimization, user experience improvements
         **Feature Generation Script:** https://github.com/your-username/fs_poc_2/blob/main/src/feature_generation/data_loader.py#L67
@@ -68,8 +80,11 @@ def get_user_behavior_features() -> FeatureView:
     )
 
 
+@lru_cache(maxsize=None)
 def get_transaction_features() -> FeatureView:
     """Get transaction feature view"""
+    from feast import FeatureView, Field
+    from feast.types import Float32, Int64, String
     return FeatureView(
         name="transaction_features",
         entities=[get_user_entity()],
@@ -86,7 +101,7 @@ def get_transaction_features() -> FeatureView:
         Transaction features derived from purchase history and payment data.
         
         **Code Logic:** https://github.com/your-username/fs_poc_2/blob/main/src/feature_generation/feature_engineering.py#L121
-        **Data Source:** Local CSV file: data/transformed/transaction_features.csv
+        **Data Source:** Local Parquet file: data/transformed/transaction_features.parquet
         **Update Frequency:** Real-time
         **Business Use Cases:** Customer lifetime value, purchase prediction, fraud detection
         **Feature Generation Script:** https://github.com/your-username/fs_poc_2/blob/main/src/feature_generation/data_loader.py#L121
@@ -94,8 +109,11 @@ def get_transaction_features() -> FeatureView:
     )
 
 
+@lru_cache(maxsize=None)
 def get_product_features() -> FeatureView:
     """Get product feature view"""
+    from feast import FeatureView, Field
+    from feast.types import Float32, Int64, String
     return FeatureView(
         name="product_features",
         entities=[get_product_entity()],
@@ -112,7 +130,7 @@ def get_product_features() -> FeatureView:
         Product features including category, price, ratings, and inventory information.
         
         **Code Logic:** https://github.com/your-username/fs_poc_2/blob/main/src/feature_generation/feature_engineering.py#L175
-        **Data Source:** Local CSV file: data/transformed/product_features.csv
+        **Data Source:** Local Parquet file: data/transformed/product_features.parquet
         **Update Frequency:** Daily
         **Business Use Cases:** Product recommendations, inventory optimization, pricing strategies
         **Feature Generation Script:** https://github.com/your-username/fs_poc_2/blob/main/src/feature_generation/data_loader.py#L175
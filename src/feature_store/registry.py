@@ -5,39 +5,164 @@ This module contains functions for registering features in Feast and exporting m
 for DataHub integration.
 """
 
+import copy
+import hashlib
 import json
+import logging
 import os
+import re
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple
 
 import yaml
 from feast import FeatureStore
 from feast.repo_config import RepoConfig
-import datetime as dt
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
+# libyaml's C loader when PyYAML was built with it, otherwise the pure-Python one
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+# Component counts go to the logger; success and failure summaries are still printed
+logger = logging.getLogger(__name__)
+
+# Flattened feature references per feature service, written by register_all_features
+FEATURE_SERVICE_VECTORS_FILE = "data/feature_service_vectors.json"
+
+# Hash of the definitions last applied by register_all_features
+REGISTRY_HASH_FILE = ".registry_hash"
+
+# Description sections: text after the marker up to the next "**" (or the end)
+BUSINESS_USE_CASES_PATTERN = re.compile(r"\*\*Business Use Cases:\*\*(.*?)(?:\*\*|\Z)", re.DOTALL)
+CODE_LOGIC_PATTERN = re.compile(r"\*\*Code Logic:\*\*(.*?)(?:\*\*|\Z)", re.DOTALL)
+
+
+@lru_cache(maxsize=1)
 def get_feature_store(repo_path: str = ".") -> FeatureStore:
-    """Get initialized feature store"""
+    """Get initialized feature store (cached so the registry is parsed once per process)"""
     return FeatureStore(repo_path=repo_path)
 
 
-def register_all_features(repo_path: str = ".", use_s3: bool = False) -> bool:
+@lru_cache(maxsize=8)
+def load_yaml_config(config_path: str, mtime_ns: int) -> Dict[str, Any]:
+    """
+    Parse a YAML config file, cached per path and modification time
+    
+    Args:
+        config_path: Absolute path of the YAML file
+        mtime_ns: File modification time; a new value invalidates the cached parse
+    
+    Returns:
+        Parsed config dictionary (shared between callers, do not mutate)
+    """
+    with open(config_path, "r") as f:
+        return yaml.load(f, Loader=YAML_LOADER)
+
+
+def local_registry_path(store: FeatureStore, repo_path: str = ".") -> Optional[str]:
+    """
+    Get the filesystem path of the Feast registry
+    
+    Args:
+        store: Initialized feature store
+        repo_path: Path to the feature store repository
+    
+    Returns:
+        Registry file path, or None when the registry is remote (e.g. s3://)
+    """
+    registry_path = store.config.registry.path
+    if "://" in registry_path:
+        return None
+    return os.path.join(repo_path, registry_path)
+
+
+def get_registry_snapshot(store: FeatureStore) -> Tuple[list, list, list]:
+    """
+    Get entities, feature views and feature services from a single registry read
+    
+    FeatureStore.list_* re-reads the registry on every call unless allow_cache is set,
+    so refresh it once and serve all three listings from that copy.
+    FeatureStore.list_feature_services takes no allow_cache argument, so services are
+    listed through the registry itself.
+    
+    Args:
+        store: Initialized feature store
+    
+    Returns:
+        Tuple of (entities, feature views, feature services)
+    """
+    store.refresh_registry()
+    return (
+        store.list_entities(allow_cache=True),
+        store.list_feature_views(allow_cache=True),
+        store.registry.list_feature_services(store.project, allow_cache=True)
+    )
+
+
+def hash_components(components: List[Any], scope: Tuple[str, ...] = ()) -> str:
+    """
+    Compute a stable hash of Feast definitions from their serialized protos
+    
+    Args:
+        components: Entities, data sources, feature views and feature services
+        scope: Strings identifying where the definitions are applied (project, registry path)
+    
+    Returns:
+        Hex digest of the scope and definitions, in order
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for part in scope:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    for component in components:
+        digest.update(component.to_proto().SerializeToString(deterministic=True))
+    return digest.hexdigest()
+
+
+def registry_has_definitions(store: FeatureStore, entities: List[Any],
+                             feature_views: List[Any], feature_services: List[Any]) -> bool:
+    """
+    Check that the registry holds every given entity, feature view and feature service
+    
+    Args:
+        store: Initialized feature store
+        entities: Expected entities
+        feature_views: Expected feature views
+        feature_services: Expected feature services
+    
+    Returns:
+        bool: True if all expected names are registered, False otherwise
+    """
+    expected = (entities, feature_views, feature_services)
+    registered = get_registry_snapshot(store)
+    return all(
+        {obj.name for obj in wanted} <= {obj.name for obj in found}
+        for wanted, found in zip(expected, registered)
+    )
+
+
+def register_all_features(repo_path: str = ".", use_s3: bool = False, force: bool = False) -> bool:
     """
     Register all features in the feature store
     
+    Skips store.apply when the definitions, project and registry path hash to the
+    same value as the last successful registration and the registry still holds them.
+    
     Args:
         repo_path: Path to the feature store repository
-        use_s3: Whether to use S3 sources instead of local CSV files
+        use_s3: Whether to use S3 sources instead of local Parquet files
+        force: Apply even if the definitions are unchanged
     
     Returns:
         bool: True if successful, False otherwise
     """
     try:
         from .entities import get_user_entity, get_product_entity
-        from .data_sources import (
-            get_user_demographic_source, get_user_behavior_source,
-            get_transaction_source, get_product_source
-        )
         from .feature_views import (
             get_user_demographic_features, get_user_behavior_features,
             get_transaction_features, get_product_features
@@ -50,22 +175,58 @@ def register_all_features(repo_path: str = ".", use_s3: bool = False) -> bool:
         # Get feature store
         store = get_feature_store(repo_path)
         
-        # Apply feature store
-        store.apply([
-            get_user_entity(),
-            get_product_entity(),
-            get_user_demographic_source(),
-            get_user_behavior_source(),
-            get_transaction_source(),
-            get_product_source(),
+        entities = [get_user_entity(), get_product_entity()]
+        feature_views = [
             get_user_demographic_features(),
             get_user_behavior_features(),
             get_transaction_features(),
-            get_product_features(),
+            get_product_features()
+        ]
+        feature_services = [
             get_user_feature_service(),
             get_product_feature_service(),
             get_behavior_feature_service()
-        ])
+        ]
+        
+        # Data sources are not listed: Feast applies each feature view's batch source
+        # itself, and the view protos (and so the hash below) embed them
+        components = [*entities, *feature_views, *feature_services]
+        
+        # The project and registry location are part of the hash so pointing the
+        # config at another project or registry forces a fresh apply.
+        registry_path = local_registry_path(store, repo_path)
+        scope = (
+            store.config.project,
+            os.path.abspath(registry_path) if registry_path else store.config.registry.path
+        )
+        components_hash = hash_components(components, scope)
+        hash_file = os.path.join(repo_path, REGISTRY_HASH_FILE)
+        registry_missing = registry_path is not None and not os.path.exists(registry_path)
+        
+        unchanged = False
+        if not force and not registry_missing and os.path.exists(hash_file):
+            with open(hash_file, "r") as f:
+                unchanged = f.read().strip() == components_hash
+        # The hash file only records what was last applied; confirm the registry agrees
+        if unchanged:
+            unchanged = registry_has_definitions(store, entities, feature_views, feature_services)
+        
+        # Apply feature store
+        if unchanged:
+            print("✅ Feature definitions unchanged, skipping registry update")
+        else:
+            # The factories memoize their objects and apply stamps timestamps and inferred
+            # columns onto what it is given, so register copies to keep the cached ones pristine
+            store.apply(copy.deepcopy(components))
+            with open(hash_file, "w") as f:
+                f.write(components_hash)
+        
+        # Resolve each service's feature references now so serving can skip the registry walk
+        vectors_file = os.path.join(repo_path, FEATURE_SERVICE_VECTORS_FILE)
+        try:
+            write_feature_service_vectors(build_feature_service_vectors(feature_services), vectors_file)
+        except OSError as e:
+            print(f"⚠️  Could not write feature service vectors: {e}")
         
         print("✅ All features registered successfully!")
         return True
@@ -75,6 +236,69 @@ def register_all_features(repo_path: str = ".", use_s3: bool = False) -> bool:
         return False
 
 
+def build_feature_service_vectors(feature_services: List[Any]) -> Dict[str, List[Dict[str, str]]]:
+    """
+    Flatten each feature service into its ordered list of features
+    
+    Args:
+        feature_services: Feature services to flatten
+    
+    Returns:
+        Dictionary mapping service name to feature entries (feature view, feature, dtype, reference)
+    """
+    vectors = {}
+    for feature_service in feature_services:
+        entries = []
+        for projection in feature_service.feature_view_projections:
+            view_name = projection.name_to_use()
+            for field in projection.features:
+                entries.append({
+                    "feature_view": view_name,
+                    "feature": field.name,
+                    "dtype": str(field.dtype),
+                    "reference": f"{view_name}:{field.name}"
+                })
+        vectors[feature_service.name] = entries
+    return vectors
+
+
+def write_feature_service_vectors(vectors: Dict[str, List[Dict[str, str]]], output_file: str) -> None:
+    """
+    Save flattened feature service vectors as JSON
+    
+    Args:
+        vectors: Output of build_feature_service_vectors
+        output_file: Path to save the JSON file
+    """
+    os.makedirs(os.path.dirname(output_file) or ".", exist_ok=True)
+    with open(output_file, "w") as f:
+        json.dump(vectors, f, indent=2)
+    load_feature_service_vectors.cache_clear()
+
+
+@lru_cache(maxsize=None)
+def load_feature_service_vectors(repo_path: str = ".") -> Dict[str, List[Dict[str, str]]]:
+    """Load the feature service vectors written at registration (cached per process)"""
+    with open(os.path.join(repo_path, FEATURE_SERVICE_VECTORS_FILE), "r") as f:
+        return json.load(f)
+
+
+def get_feature_service_references(service_name: str, repo_path: str = ".") -> List[str]:
+    """
+    Get the "feature_view:feature" references of a feature service without resolving it in the registry
+    
+    The result can be passed straight to store.get_online_features(features=...).
+    
+    Args:
+        service_name: Name of the feature service
+        repo_path: Path to the feature store repository
+    
+    Returns:
+        List of feature references, in service order
+    """
+    return [entry["reference"] for entry in load_feature_service_vectors(repo_path)[service_name]]
+
+
 def validate_feature_store(repo_path: str = ".") -> bool:
     """
     Validate the feature store configuration
@@ -87,18 +311,13 @@ def validate_feature_store(repo_path: str = ".") -> bool:
     """
     try:
         store = get_feature_store(repo_path)
+        entities, feature_views, feature_services = get_registry_snapshot(store)
         
-        # Check entities
-        entities = store.list_entities()
-        print(f"📊 Found {len(entities)} entities")
-        
-        # Check feature views
-        feature_views = store.list_feature_views()
-        print(f"📊 Found {len(feature_views)} feature views")
-        
-        # Check feature services
-        feature_services = store.list_feature_services()
-        print(f"📊 Found {len(feature_services)} feature services")
+        # Check entities, feature views and feature services
+        logger.info(
+            "📊 Found %d entities, %d feature views, %d feature services",
+            len(entities), len(feature_views), len(feature_services)
+        )
         
         return True
         
@@ -120,10 +339,12 @@ def export_metadata(repo_path: str = ".", output_file: str = "data/feature_metad
     """
     try:
         store = get_feature_store(repo_path)
+        entities, all_feature_views, feature_services = get_registry_snapshot(store)
+        feature_views_by_name = {feature_view.name: feature_view for feature_view in all_feature_views}
         
-        # Load config using PyYAML
-        with open(os.path.join(repo_path, "configs", "feature_store.yaml"), "r") as f:
-            config = yaml.safe_load(f)
+        # Load config using PyYAML (cached until the file changes)
+        config_path = os.path.abspath(os.path.join(repo_path, "configs", "feature_store.yaml"))
+        config = load_yaml_config(config_path, os.stat(config_path).st_mtime_ns)
         
         # Create Feast standard metadata structure
         feature_metadata = {
@@ -147,13 +368,9 @@ def export_metadata(repo_path: str = ".", output_file: str = "data/feature_metad
         }
         
         # Export entity metadata (Feast standard)
-        for entity in store.list_entities():
-            created_ts = getattr(entity, 'created_timestamp', None)
-            if isinstance(created_ts, dt.datetime):
-                created_ts = created_ts.isoformat()
-            updated_ts = getattr(entity, 'last_updated_timestamp', None)
-            if isinstance(updated_ts, dt.datetime):
-                updated_ts = updated_ts.isoformat()
+        for entity in entities:
+            created_ts = isoformat_timestamp(entity, 'created_timestamp')
+            updated_ts = isoformat_timestamp(entity, 'last_updated_timestamp')
             entity_metadata = {
                 "name": entity.name,
                 "description": entity.description or "",
@@ -168,8 +385,8 @@ def export_metadata(repo_path: str = ".", output_file: str = "data/feature_metad
         
         # Export data source metadata (Feast standard)
         data_sources = set()
-        for feature_view in store.list_feature_views():
-            source = feature_view.source
+        for feature_view in all_feature_views:
+            source = feature_view.batch_source
             if source.name not in data_sources:
                 data_sources.add(source.name)
                 source_metadata = {
@@ -184,32 +401,33 @@ def export_metadata(repo_path: str = ".", output_file: str = "data/feature_metad
                 feature_metadata["data_sources"].append(source_metadata)
         
         # Export feature view metadata (Feast standard)
-        for feature_view in store.list_feature_views():
+        for feature_view in all_feature_views:
+            schema = feature_view.schema
+            source = feature_view.batch_source
+            description = feature_view.description or ""
+            
             # Get feature schema details
-            schema_fields = []
-            for field in feature_view.schema:
-                schema_fields.append({
+            schema_fields = [
+                {
                     "name": field.name,
                     "dtype": str(field.dtype),
                     "description": field.description or "",
                     "tags": getattr(field, 'tags', [])
-                })
+                }
+                for field in schema
+            ]
             
-            created_ts = getattr(feature_view, 'created_timestamp', None)
-            if isinstance(created_ts, dt.datetime):
-                created_ts = created_ts.isoformat()
-            updated_ts = getattr(feature_view, 'last_updated_timestamp', None)
-            if isinstance(updated_ts, dt.datetime):
-                updated_ts = updated_ts.isoformat()
+            created_ts = isoformat_timestamp(feature_view, 'created_timestamp')
+            updated_ts = isoformat_timestamp(feature_view, 'last_updated_timestamp')
             feature_view_metadata = {
                 "name": feature_view.name,
-                "description": feature_view.description or "",
-                "entities": [entity if isinstance(entity, str) else entity.name for entity in feature_view.entities],
+                "description": description,
+                "entities": entity_names(feature_view),
                 "schema": schema_fields,
                 "ttl": str(feature_view.ttl) if feature_view.ttl else None,
                 "source": {
-                    "name": feature_view.source.name,
-                    "type": feature_view.source.__class__.__name__
+                    "name": source.name,
+                    "type": source.__class__.__name__
                 },
                 "tags": getattr(feature_view, 'tags', []),
                 "owner": getattr(feature_view, 'owner', None),
@@ -221,30 +439,23 @@ def export_metadata(repo_path: str = ".", output_file: str = "data/feature_metad
                     "urn": f"urn:li:dataset:(urn:li:dataPlatform:feast,{feature_view.name},PROD)",
                     "platform": "feast",
                     "properties": {
-                        "feature_count": len(feature_view.schema),
+                        "feature_count": len(schema),
                         "entity_count": len(feature_view.entities),
                         "ttl_days": feature_view.ttl.days if feature_view.ttl else None,
                         "update_frequency": "daily", # Could be extracted from description
-                        "business_use_cases": extract_business_use_cases(feature_view.description or ""),
-                        "code_logic_url": extract_code_logic_url(feature_view.description or "")
+                        "business_use_cases": extract_business_use_cases(description),
+                        "code_logic_url": extract_code_logic_url(description)
                     }
                 }
             }
             feature_metadata["feature_views"].append(feature_view_metadata)
         
         # Export feature service metadata (Feast standard)
-        for feature_service in store.list_feature_services():
-            try:
-                feature_views = [fv.name for fv in feature_service._features] if hasattr(feature_service, '_features') else []
-            except Exception:
-                feature_views = []
+        for feature_service in feature_services:
+            feature_views = [projection.name for projection in feature_service.feature_view_projections]
             
-            created_ts = getattr(feature_service, 'created_timestamp', None)
-            if isinstance(created_ts, dt.datetime):
-                created_ts = created_ts.isoformat()
-            updated_ts = getattr(feature_service, 'last_updated_timestamp', None)
-            if isinstance(updated_ts, dt.datetime):
-                updated_ts = updated_ts.isoformat()
+            created_ts = isoformat_timestamp(feature_service, 'created_timestamp')
+            updated_ts = isoformat_timestamp(feature_service, 'last_updated_timestamp')
             feature_service_metadata = {
                 "name": feature_service.name,
                 "description": feature_service.description or "",
@@ -260,7 +471,7 @@ def export_metadata(repo_path: str = ".", output_file: str = "data/feature_metad
                     "platform": "feast",
                     "properties": {
                         "feature_view_count": len(feature_views),
-                        "total_features": sum(len(store.get_feature_view(fv_name).schema) for fv_name in feature_views if store.get_feature_view(fv_name)),
+                        "total_features": sum(len(feature_views_by_name[fv_name].schema) for fv_name in feature_views if fv_name in feature_views_by_name),
                         "service_type": "FeatureService"
                     }
                 }
@@ -271,14 +482,14 @@ def export_metadata(repo_path: str = ".", output_file: str = "data/feature_metad
         os.makedirs(os.path.dirname(output_file), exist_ok=True)
         
         # Save metadata to file
-        with open(output_file, "w") as f:
-            json.dump(feature_metadata, f, indent=2)
+        write_metadata_json(feature_metadata, output_file)
         
         print(f"✅ Feature metadata exported to {output_file}")
-        print(f"📊 Total: {len(feature_metadata['entities'])} entities, "
-              f"{len(feature_metadata['data_sources'])} data sources, "
-              f"{len(feature_metadata['feature_views'])} feature views, "
-              f"{len(feature_metadata['feature_services'])} feature services")
+        logger.info(
+            "📊 Total: %d entities, %d data sources, %d feature views, %d feature services",
+            len(feature_metadata['entities']), len(feature_metadata['data_sources']),
+            len(feature_metadata['feature_views']), len(feature_metadata['feature_services'])
+        )
         
         return True
         
@@ -287,72 +498,124 @@ def export_metadata(repo_path: str = ".", output_file: str = "data/feature_metad
         return False
 
 
+def entity_names(feature_view: Any) -> List[str]:
+    """Get a feature view's entity names (Feast stores names; older versions stored Entity objects)"""
+    entities = feature_view.entities
+    if entities and not isinstance(entities[0], str):
+        return [entity.name for entity in entities]
+    return list(entities)
+
+
+def isoformat_timestamp(obj: Any, attr: str) -> Any:
+    """Get a timestamp attribute as an ISO string (None and non-datetime values pass through)"""
+    value = getattr(obj, attr, None)
+    return value.isoformat() if hasattr(value, 'isoformat') else value
+
+
+def dumps_indented(value: Any) -> bytes:
+    """Serialize a value as 2-space indented JSON, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2)
+    return json.dumps(value, indent=2).encode("utf-8")
+
+
+def write_metadata_json(feature_metadata: Dict[str, Any], output_file: str) -> None:
+    """
+    Write metadata as indented JSON, streaming top-level lists one record at a time
+    
+    The layout matches json.dump(..., indent=2), but the document is never built
+    as a single string in memory.
+    
+    Args:
+        feature_metadata: Metadata dictionary to write
+        output_file: Path to save the JSON file
+    """
+    with open(output_file, "wb") as f:
+        f.write(b"{")
+        for i, (key, value) in enumerate(feature_metadata.items()):
+            f.write(b",\n  " if i else b"\n  ")
+            f.write(dumps_indented(key) + b": ")
+            if isinstance(value, list) and value:
+                f.write(b"[")
+                for j, item in enumerate(value):
+                    f.write(b",\n    " if j else b"\n    ")
+                    # Serialized strings escape their newlines, so only layout newlines are re-indented
+                    f.write(dumps_indented(item).replace(b"\n", b"\n    "))
+                f.write(b"\n  ]")
+            else:
+                f.write(dumps_indented(value).replace(b"\n", b"\n  "))
+        f.write(b"\n}")
+
+
 def extract_business_use_cases(description: str) -> List[str]:
     """Extract business use cases from feature view description"""
-    use_cases = []
-    if "**Business Use Cases:**" in description:
-        try:
-            use_cases_section = description.split("**Business Use Cases:**")[1].split("**")[0]
-            use_cases = [uc.strip() for uc in use_cases_section.split(",") if uc.strip()]
-        except:
-            pass
-    return use_cases
+    match = BUSINESS_USE_CASES_PATTERN.search(description)
+    if not match:
+        return []
+    return [uc.strip() for uc in match.group(1).split(",") if uc.strip()]
 
 
 def extract_code_logic_url(description: str) -> Optional[str]:
     """Extract code logic URL from feature view description"""
-    if "**Code Logic:**" in description:
-        try:
-            url_section = description.split("**Code Logic:**")[1].split("**")[0]
-            return url_section.strip()
-        except:
-            pass
-    return None
+    match = CODE_LOGIC_PATTERN.search(description)
+    return match.group(1).strip() if match else None
 
 
 def list_registered_features(repo_path: str = ".") -> Dict[str, Any]:
-    """List all registered features in the feature store"""
+    """List all registered features in the feature store (cached until the local registry changes)"""
     try:
         store = get_feature_store(repo_path)
-        
-        features = {
-            "entities": [],
-            "feature_views": [],
-            "feature_services": []
-        }
-        
-        # List entities
-        for entity in store.list_entities():
-            features["entities"].append({
-                "name": entity.name,
-                "description": entity.description,
-                "value_type": str(entity.value_type)
-            })
-        
-        # List feature views
-        for feature_view in store.list_feature_views():
-            features["feature_views"].append({
-                "name": feature_view.name,
-                "description": feature_view.description,
-                "entities": [entity.name for entity in feature_view.entities],
-                "features": [field.name for field in feature_view.schema]
-            })
-        
-        # List feature services
-        for feature_service in store.list_feature_services():
-            try:
-                feature_views = [fv.name for fv in feature_service._features] if hasattr(feature_service, '_features') else []
-            except Exception:
-                feature_views = []
-            
-            features["feature_services"].append({
-                "name": feature_service.name,
-                "description": feature_service.description,
-                "feature_views": feature_views
-            })
-        
-        return features
+        registry_path = local_registry_path(store, repo_path)
+        if registry_path is None:
+            return collect_registered_features(store)
+        return cached_registered_features(repo_path, os.stat(registry_path).st_mtime_ns)
         
     except Exception as e:
         print(f"❌ Error listing features: {e}")
-        return {} 
\ No newline at end of file
+        return {}
+
+
+@lru_cache(maxsize=4)
+def cached_registered_features(repo_path: str, registry_mtime_ns: int) -> Dict[str, Any]:
+    """Registered features for a registry version; a new mtime invalidates the entry (do not mutate)"""
+    return collect_registered_features(get_feature_store(repo_path))
+
+
+def collect_registered_features(store: FeatureStore) -> Dict[str, Any]:
+    """Collect entity, feature view and feature service summaries from the registry"""
+    entities, all_feature_views, feature_services = get_registry_snapshot(store)
+    
+    features = {
+        "entities": [],
+        "feature_views": [],
+        "feature_services": []
+    }
+    
+    # List entities
+    for entity in entities:
+        features["entities"].append({
+            "name": entity.name,
+            "description": entity.description,
+            "value_type": str(entity.value_type)
+        })
+    
+    # List feature views
+    for feature_view in all_feature_views:
+        features["feature_views"].append({
+            "name": feature_view.name,
+            "description": feature_view.description,
+            "entities": entity_names(feature_view),
+            "features": [field.name for field in feature_view.schema]
+        })
+    
+    # List feature services
+    for feature_service in feature_services:
+        feature_views = [projection.name for projection in feature_service.feature_view_projections]
+        
+        features["feature_services"].append({
+            "name": feature_service.name,
+            "description": feature_service.description,
+            "feature_views": feature_views
+        })
+    
+    return features
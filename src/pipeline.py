@@ -5,22 +5,23 @@ This module orchestrates the entire feature generation and registration process,
 including data loading, feature engineering, export, and Feast registration.
 """
 
+import logging
 import sys
-import os
 from typing import Dict, Optional
 
-# Add src to path for imports
-sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
-
 from feature_generation.data_loader import load_raw_data, validate_raw_data
 from feature_generation.feature_engineering import engineer_all_features, validate_engineered_features
 from feature_generation.data_exporter import (
-    export_features_to_csv, export_raw_data_to_csv,
+    export_features_to_parquet, export_raw_data_to_parquet,
     create_feature_summary, validate_exported_files
 )
 from feature_store.registry import register_all_features, export_metadata, validate_feature_store
 
 
+# Step-by-step progress goes to the logger (shown with --verbose); outcomes are still printed
+logger = logging.getLogger(__name__)
+
+
 def generate_all_features(
     data_dir: str = "data",
     export_raw: bool = True,
@@ -32,7 +33,7 @@ def generate_all_features(
     
     Args:
         data_dir: Base directory for data
-        export_raw: Whether to export raw data to CSV
+        export_raw: Whether to export raw data to Parquet
         create_summary: Whether to create feature summary
         validate_export: Whether to validate exported files
     
@@ -43,7 +44,7 @@ def generate_all_features(
     print("=" * 60)
     
     # Step 1: Load raw data
-    print("\n📊 Step 1: Loading raw data...")
+    logger.info("📊 Step 1: Loading raw data...")
     raw_data = load_raw_data(f"{data_dir}/raw")
     
     if not validate_raw_data(raw_data):
@@ -52,11 +53,11 @@ def generate_all_features(
     
     # Step 2: Export raw data (optional)
     if export_raw:
-        print("\n📤 Step 2: Exporting raw data...")
-        export_raw_data_to_csv(raw_data, f"{data_dir}/raw")
+        logger.info("📤 Step 2: Exporting raw data...")
+        export_raw_data_to_parquet(raw_data, f"{data_dir}/raw")
     
     # Step 3: Engineer features
-    print("\n🔧 Step 3: Engineering features...")
+    logger.info("🔧 Step 3: Engineering features...")
     engineered_features = engineer_all_features(raw_data)
     
     if not validate_engineered_features(engineered_features):
@@ -64,20 +65,20 @@ def generate_all_features(
         return {}
     
     # Step 4: Export engineered features
-    print("\n📤 Step 4: Exporting engineered features...")
-    if not export_features_to_csv(engineered_features, f"{data_dir}/transformed"):
+    logger.info("📤 Step 4: Exporting engineered features...")
+    if not export_features_to_parquet(engineered_features, f"{data_dir}/transformed"):
         print("❌ Feature export failed!")
         return {}
     
     # Step 5: Create summary (optional)
     if create_summary:
-        print("\n📋 Step 5: Creating feature summary...")
+        logger.info("📋 Step 5: Creating feature summary...")
         create_feature_summary(engineered_features, f"{data_dir}/feature_summary.txt")
     
     # Step 6: Validate exported files (optional)
     if validate_export:
-        print("\n🔍 Step 6: Validating exported files...")
-        if not validate_exported_files(engineered_features, f"{data_dir}/transformed"):
+        logger.info("🔍 Step 6: Validating exported files...")
+        if not validate_exported_files(engineered_features, f"{data_dir}/transformed", file_format="parquet"):
             print("❌ File validation failed!")
             return {}
     
@@ -100,7 +101,7 @@ def register_features_in_feast(
     
     Args:
         repo_path: Path to feature store repository
-        use_s3: Whether to use S3 sources instead of local CSV files
+        use_s3: Whether to use S3 sources instead of local Parquet files
         export_metadata: Whether to export metadata for DataHub
     
     Returns:
@@ -110,25 +111,25 @@ def register_features_in_feast(
     print("=" * 60)
     
     # Step 1: Register all features
-    print("\n📝 Step 1: Registering features in Feast...")
+    logger.info("📝 Step 1: Registering features in Feast...")
     if not register_all_features(repo_path, use_s3):
         print("❌ Feature registration failed!")
         return False
     
     # Step 2: Validate feature store
-    print("\n🔍 Step 2: Validating feature store...")
+    logger.info("🔍 Step 2: Validating feature store...")
     if not validate_feature_store(repo_path):
         print("❌ Feature store validation failed!")
         return False
     
     # Step 3: Export metadata (optional)
     if should_export_metadata:
-        print("\n📤 Step 3: Exporting metadata for DataHub...")
+        logger.info("📤 Step 3: Exporting metadata for DataHub...")
         if not export_metadata(repo_path, "data/feature_metadata.json"):
             print("⚠️ Metadata export failed, but continuing...")
     
     # Step 4: Run DataHub ingestion (optional)
-    print("\n🔗 Step 4: Running DataHub ingestion...")
+    logger.info("🔗 Step 4: Running DataHub ingestion...")
     try:
         from datahub_integration import run_datahub_ingestion
         if not run_datahub_ingestion(verbose=False):
@@ -157,8 +158,8 @@ def run_complete_pipeline(
     Args:
         data_dir: Base directory for data
         repo_path: Path to feature store repository
-        use_s3: Whether to use S3 sources instead of local CSV files
-        export_raw: Whether to export raw data to CSV
+        use_s3: Whether to use S3 sources instead of local Parquet files
+        export_raw: Whether to export raw data to Parquet
         create_summary: Whether to create feature summary
         validate_export: Whether to validate exported files
         export_metadata: Whether to export metadata for DataHub
@@ -209,16 +210,20 @@ def main():
     parser = argparse.ArgumentParser(description="Feature Store Pipeline")
     parser.add_argument("--data-dir", default="data", help="Data directory")
     parser.add_argument("--repo-path", default=".", help="Feature store repository path")
-    parser.add_argument("--use-s3", action="store_true", help="Use S3 sources instead of local CSV")
+    parser.add_argument("--use-s3", action="store_true", help="Use S3 sources instead of local Parquet")
     parser.add_argument("--skip-raw-export", action="store_true", help="Skip raw data export")
     parser.add_argument("--skip-summary", action="store_true", help="Skip feature summary creation")
     parser.add_argument("--skip-validation", action="store_true", help="Skip file validation")
     parser.add_argument("--skip-metadata", action="store_true", help="Skip metadata export")
     parser.add_argument("--generate-only", action="store_true", help="Only generate features, don't register")
     parser.add_argument("--register-only", action="store_true", help="Only register features, don't generate")
+    parser.add_argument("--verbose", action="store_true", help="Show step-by-step progress")
     
     args = parser.parse_args()
     
+    if args.verbose:
+        logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+    
     if args.generate_only:
         # Only generate features
         result = generate_all_features(
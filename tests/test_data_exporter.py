@@ -0,0 +1,19 @@
+"""
+Tests for export file inspection helpers
+"""
+
+from feature_generation.data_exporter import read_csv_shape
+
+
+def test_read_csv_shape_counts_records_not_lines(tmp_path):
+    filepath = tmp_path / "users.csv"
+    filepath.write_text('user_id,bio\n1,"first line\nsecond line"\n2,plain\n')
+    
+    assert read_csv_shape(str(filepath)) == (2, ["user_id", "bio"])
+
+
+def test_read_csv_shape_header_only(tmp_path):
+    filepath = tmp_path / "empty.csv"
+    filepath.write_text("user_id,bio\n")
+    
+    assert read_csv_shape(str(filepath)) == (0, ["user_id", "bio"])
@@ -0,0 +1,22 @@
+"""
+Tests for the feature engineering pipeline
+"""
+
+from feature_generation.data_loader import generate_all_sample_data
+from feature_generation.feature_engineering import engineer_all_features
+
+
+def test_engineer_all_features_progress_is_ordered(capsys):
+    raw_data = generate_all_sample_data(n_users=200, n_products=50)
+    
+    engineered_features = engineer_all_features(raw_data)
+    
+    lines = capsys.readouterr().out.splitlines()
+    progress = [line for line in lines if line.startswith(("🔧 Engineering", "✅ Engineered"))]
+    names = ["user demographic", "user behavior", "transaction", "product"]
+    assert progress == (
+        [f"🔧 Engineering {name} features..." for name in names]
+        + [f"✅ Engineered {len(df)} {name} features"
+           for name, df in zip(names, engineered_features.values())]
+    )
+    assert list(engineered_features) == ["user_demographic", "user_behavior", "transaction", "product"]
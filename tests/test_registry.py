@@ -0,0 +1,158 @@
+"""
+Registry tests against a Feast-signature-checked fake store
+
+The fake is autospecced from FeatureStore and BaseRegistry, so calling a Feast
+method with arguments it does not accept fails the test instead of being
+swallowed by the registry functions' error handling.
+"""
+
+import json
+import shutil
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import create_autospec
+
+import pytest
+
+pytest.importorskip("feast")
+
+from feast import FeatureStore
+from feast.infra.registry.base_registry import BaseRegistry
+
+from feature_store import registry
+from feature_store.entities import get_all_entities
+from feature_store.feature_services import get_all_feature_services
+from feature_store.feature_views import get_all_feature_views
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture
+def repo_path(tmp_path):
+    """Feature repo with the project's config and an (empty) local registry file"""
+    (tmp_path / "configs").mkdir()
+    shutil.copy(PROJECT_ROOT / "configs" / "feature_store.yaml", tmp_path / "configs")
+    (tmp_path / "data").mkdir()
+    (tmp_path / "data" / "registry.db").touch()
+    return str(tmp_path)
+
+
+@pytest.fixture
+def store(monkeypatch):
+    """Fake FeatureStore holding this project's definitions"""
+    fake = create_autospec(FeatureStore, instance=True)
+    fake.project = "fs_poc_2"
+    fake.config = SimpleNamespace(project="fs_poc_2", registry=SimpleNamespace(path="data/registry.db"))
+    fake.registry = create_autospec(BaseRegistry, instance=True)
+    fake.list_entities.return_value = get_all_entities()
+    fake.list_feature_views.return_value = get_all_feature_views()
+    fake.registry.list_feature_services.return_value = get_all_feature_services()
+    
+    monkeypatch.setattr(registry, "get_feature_store", lambda repo_path=".": fake)
+    registry.cached_registered_features.cache_clear()
+    return fake
+
+
+def test_registry_snapshot_reads_registry_once(store):
+    entities, feature_views, feature_services = registry.get_registry_snapshot(store)
+    
+    store.refresh_registry.assert_called_once_with()
+    assert len(entities) == 2
+    assert len(feature_views) == 4
+    assert len(feature_services) == 3
+
+
+def test_validate_feature_store(store, repo_path):
+    assert registry.validate_feature_store(repo_path) is True
+
+
+def test_export_metadata(store, repo_path):
+    output_file = str(Path(repo_path) / "out" / "feature_metadata.json")
+    
+    assert registry.export_metadata(repo_path, output_file) is True
+    
+    with open(output_file) as f:
+        metadata = json.load(f)
+    assert metadata["project"] == "fs_poc_2"
+    assert [entity["name"] for entity in metadata["entities"]] == ["user_id", "product_id"]
+    assert len(metadata["data_sources"]) == 4
+    assert len(metadata["feature_views"]) == 4
+    
+    services = {service["name"]: service for service in metadata["feature_services"]}
+    assert services["product_feature_service"]["feature_views"] == ["product_features"]
+    assert services["user_feature_service"]["datahub"]["properties"]["total_features"] == 15
+
+
+def test_list_registered_features(store, repo_path):
+    features = registry.list_registered_features(repo_path)
+    
+    assert [view["name"] for view in features["feature_views"]] == [
+        "user_demographic_features", "user_behavior_features",
+        "transaction_features", "product_features"
+    ]
+    assert features["feature_views"][0]["entities"] == ["user_id"]
+
+
+def test_register_skips_unchanged_definitions(store, repo_path):
+    assert registry.register_all_features(repo_path) is True
+    assert registry.register_all_features(repo_path) is True
+    
+    assert store.apply.call_count == 1
+
+
+def test_register_applies_when_project_changes(store, repo_path):
+    assert registry.register_all_features(repo_path) is True
+    store.config.project = "other_project"
+    assert registry.register_all_features(repo_path) is True
+    
+    assert store.apply.call_count == 2
+
+
+def test_register_applies_when_registry_lacks_definitions(store, repo_path):
+    assert registry.register_all_features(repo_path) is True
+    store.list_feature_views.return_value = []
+    assert registry.register_all_features(repo_path) is True
+    
+    assert store.apply.call_count == 2
+
+
+@pytest.fixture
+def local_repo(tmp_path, monkeypatch):
+    """Feature repo with a real local registry and exported sample features"""
+    from feature_generation.data_exporter import export_features_to_parquet
+    from feature_generation.data_loader import generate_all_sample_data
+    from feature_generation.feature_engineering import engineer_all_features
+    
+    (tmp_path / "feature_store.yaml").write_text(
+        "project: fs_poc_2\n"
+        "provider: local\n"
+        "registry: data/registry.db\n"
+        "online_store:\n"
+        "  type: sqlite\n"
+        "  path: data/online_store.db\n"
+        "entity_key_serialization_version: 2\n"
+    )
+    raw_data = generate_all_sample_data(n_users=50, n_products=20)
+    assert export_features_to_parquet(engineer_all_features(raw_data), str(tmp_path / "data" / "transformed"))
+    
+    # FileSource paths are relative to the working directory
+    monkeypatch.chdir(tmp_path)
+    registry.get_feature_store.cache_clear()
+    yield str(tmp_path)
+    registry.get_feature_store.cache_clear()
+
+
+def test_register_twice_in_one_process_skips_second_apply(local_repo, monkeypatch):
+    applied = []
+    original_apply = FeatureStore.apply
+    monkeypatch.setattr(FeatureStore, "apply", lambda self, objects, *args, **kwargs: (
+        applied.append(objects), original_apply(self, objects, *args, **kwargs)
+    )[1])
+    hash_file = Path(local_repo) / registry.REGISTRY_HASH_FILE
+    
+    assert registry.register_all_features(local_repo) is True
+    first_hash = hash_file.read_text()
+    assert registry.register_all_features(local_repo) is True
+    
+    assert hash_file.read_text() == first_hash
+    assert len(applied) == 1